@@ -0,0 +1,237 @@
+"""
+Headless bar construction benchmark.
+
+Builds N bars with M widgets each through BarManager.initialize_bars and the real WidgetBuilder on Qt's
+offscreen platform, with Win32-only modules replaced by stubs so the benchmark can run on any Linux box.
+
+Usage:
+    python benchmarks/bar_benchmark.py --bars 3 --widgets 10 --repeat 5 --output bar_benchmark.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import types
+from os import path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+SRC_DIR = path.join(path.dirname(path.dirname(path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# Widget types which can be constructed without Win32 APIs, cycled through to fill each bar
+BENCHMARK_WIDGETS = {
+    'clock': {'type': 'yasb.clock.ClockWidget', 'options': {'label': '{%H:%M:%S}'}},
+    'cpu': {'type': 'yasb.cpu.CpuWidget', 'options': {}},
+    'memory': {'type': 'yasb.memory.MemoryWidget', 'options': {}},
+    'traffic': {'type': 'yasb.traffic.TrafficWidget', 'options': {}},
+    'custom': {'type': 'yasb.custom.CustomWidget', 'options': {'label': 'custom', 'label_alt': 'custom', 'class_name': 'bench'}}
+}
+
+
+def install_win32_stubs() -> None:
+    class AppBarEdge:
+        Left = 0
+        Top = 1
+        Right = 2
+        Bottom = 3
+
+    class Win32AppBar:
+        def create_appbar(self, *_args, **_kwargs):
+            pass
+
+        def remove_appbar(self):
+            pass
+
+    app_bar = types.ModuleType("core.utils.win32.app_bar")
+    app_bar.AppBarEdge = AppBarEdge
+    app_bar.Win32AppBar = Win32AppBar
+    sys.modules["core.utils.win32.app_bar"] = app_bar
+
+    blur_window = types.ModuleType("BlurWindow")
+    blur_window_module = types.ModuleType("BlurWindow.blurWindow")
+    blur_window_module.GlobalBlur = lambda *_args, **_kwargs: None
+    blur_window.blurWindow = blur_window_module
+    sys.modules.setdefault("BlurWindow", blur_window)
+    sys.modules.setdefault("BlurWindow.blurWindow", blur_window_module)
+
+
+def build_config(num_bars: int, num_widgets: int) -> dict:
+    from cerberus import Validator
+    from core.validation.config import CONFIG_SCHEMA
+
+    widget_names = list(BENCHMARK_WIDGETS.keys())
+    bar_widgets = [widget_names[i % len(widget_names)] for i in range(num_widgets)]
+    raw_config = {
+        'watch_config': False,
+        'watch_stylesheet': False,
+        'bars': {
+            f"bench-bar-{i}": {
+                'enabled': True,
+                'screens': ['*'],
+                'widgets': {
+                    'left': bar_widgets[:num_widgets // 3],
+                    'center': bar_widgets[num_widgets // 3:2 * num_widgets // 3],
+                    'right': bar_widgets[2 * num_widgets // 3:]
+                }
+            } for i in range(num_bars)
+        },
+        'widgets': BENCHMARK_WIDGETS
+    }
+
+    validator = Validator(CONFIG_SCHEMA)
+    if not validator.validate(raw_config):
+        raise ValueError(f"Invalid benchmark config: {validator.errors}")
+    return validator.normalized(raw_config)
+
+
+def count_qobjects(manager) -> int:
+    from PyQt6.QtCore import QObject
+    return sum(1 + len(bar.findChildren(QObject)) for bar in manager.bars)
+
+
+def load_stylesheet() -> str:
+    from settings import DEFAULT_STYLES_FILENAME
+
+    # The bundled stylesheet is loaded explicitly, as yasb looks for its default styles next to the launched script
+    with open(path.join(SRC_DIR, DEFAULT_STYLES_FILENAME), encoding="utf-8") as styles_stream:
+        return styles_stream.read()
+
+
+def wait_for_workers(app) -> None:
+    from core.utils.data_provider import get_provider_pool
+    from core.utils.metric_provider import get_sampling_pool
+    from core.utils.process_runner import get_command_pool
+
+    # Samples, commands and data providers run on worker pools and deliver their results through queued signals
+    for pool in (get_sampling_pool(), get_command_pool(), get_provider_pool()):
+        pool.waitForDone()
+    app.processEvents()
+
+
+def run_timer_callbacks(app) -> tuple[int, int]:
+    from core.utils.render_queue import render_queue
+    from core.utils.tick_scheduler import tick_scheduler
+
+    # Runs every interval group of the shared tick scheduler once, as if all groups became due together,
+    # waits for the samples requested by the callbacks to be delivered to the widgets, then applies the
+    # label updates queued by the widgets as the next event loop pass would
+    num_callbacks = tick_scheduler.num_callbacks
+    num_skipped = render_queue.num_skipped
+    tick_scheduler.tick()
+    wait_for_workers(app)
+    render_queue.flush()
+    return tick_scheduler.num_callbacks - num_callbacks, render_queue.num_skipped - num_skipped
+
+
+def close_bars(app, manager) -> None:
+    from PyQt6.QtCore import QEvent
+
+    # Deferred deletes are not processed outside of a running event loop, so flush them explicitly
+    manager.close_bars()
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def run_benchmark(app, num_bars: int, num_widgets: int, repeat: int) -> dict:
+    from core.bar_manager import BarManager
+
+    config = build_config(num_bars, num_widgets)
+    manager = BarManager(config, load_stylesheet())
+    build_times, tick_times = [], []
+    num_callbacks = num_skipped_renders = 0
+
+    for _ in range(repeat):
+        close_bars(app, manager)
+        gc.collect()
+
+        start = time.perf_counter()
+        manager.initialize_bars(init=True)
+        build_times.append((time.perf_counter() - start) * 1000)
+
+        # The first samples requested by the new widgets would otherwise overlap the timed tick
+        wait_for_workers(app)
+
+        start = time.perf_counter()
+        num_callbacks, num_skipped_renders = run_timer_callbacks(app)
+        tick_times.append((time.perf_counter() - start) * 1000)
+
+    result = {
+        'bars': len(manager.bars),
+        'widgets_per_bar': num_widgets,
+        'repeat': repeat,
+        'build_ms_median': statistics.median(build_times),
+        'build_ms_min': min(build_times),
+        'tick_ms_median': statistics.median(tick_times),
+        'tick_callbacks': num_callbacks,
+        'tick_skipped_renders': num_skipped_renders,
+        'live_qobjects': count_qobjects(manager),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+    close_bars(app, manager)
+    return result
+
+
+def print_table(results: list[dict]) -> None:
+    columns = [
+        ('bars', 'bars', '{}'),
+        ('widgets/bar', 'widgets_per_bar', '{}'),
+        ('build median (ms)', 'build_ms_median', '{:.2f}'),
+        ('build min (ms)', 'build_ms_min', '{:.2f}'),
+        ('tick median (ms)', 'tick_ms_median', '{:.2f}'),
+        ('callbacks/tick', 'tick_callbacks', '{}'),
+        ('skipped renders/tick', 'tick_skipped_renders', '{}'),
+        ('QObjects', 'live_qobjects', '{}'),
+        ('peak RSS (MB)', 'peak_rss_mb', '{:.1f}')
+    ]
+    rows = [[fmt.format(result[key]) for _, key, fmt in columns] for result in results]
+    widths = [max(len(title), *(len(row[i]) for row in rows)) for i, (title, _, _) in enumerate(columns)]
+
+    print("  ".join(title.rjust(width) for (title, _, _), width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless yasb bar construction and widget ticks.")
+    parser.add_argument("--bars", type=int, nargs="+", default=[1, 3], help="numbers of bars to build")
+    parser.add_argument("--widgets", type=int, nargs="+", default=[5, 10], help="numbers of widgets per bar")
+    parser.add_argument("--repeat", type=int, default=5, help="number of build/tick rounds per configuration")
+    parser.add_argument("--output", default="bar_benchmark.json", help="path of the JSON results file")
+    args = parser.parse_args()
+
+    install_win32_stubs()
+
+    # A single application is shared by all runs, as the tick scheduler's timer lives as long as the application
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([])
+    results = [
+        run_benchmark(app, num_bars, num_widgets, args.repeat)
+        for num_bars in args.bars for num_widgets in args.widgets
+    ]
+    print_table(results)
+
+    with open(args.output, 'w') as output_stream:
+        json.dump({
+            'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'qt_platform': os.environ["QT_QPA_PLATFORM"],
+            'results': results
+        }, output_stream, indent=2)
+    print(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
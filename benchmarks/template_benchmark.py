@@ -0,0 +1,186 @@
+"""
+Label formatting benchmark.
+
+Compares the per-tick cost of formatting the default labels of the built-in widgets with the compiled label
+templates against the ad-hoc formatting the widgets used before (str.replace chains, str.format, re.search and
+uncached humanize.naturalsize calls). Byte counts which change between ticks, such as free memory and transfer
+speeds, differ on every render, so only sizes which really repeat, such as total memory, are cached. Like the
+widget, the memory label only formats the options it references. The battery widget still uses str.replace, which
+is cheaper for its short label, so it is not compared. No Qt application is needed.
+
+Usage:
+    python benchmarks/template_benchmark.py --number 20000 --output template_benchmark.json
+"""
+import argparse
+import itertools
+import json
+import platform
+import re
+import sys
+import time
+import timeit
+from collections import namedtuple
+from datetime import datetime
+from os import path
+
+SRC_DIR = path.join(path.dirname(path.dirname(path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+VirtualMemory = namedtuple("VirtualMemory", ["total", "available", "percent", "free"])
+SwapMemory = namedtuple("SwapMemory", ["total", "percent", "free"])
+
+VIRTUAL_MEM = VirtualMemory(total=17_071_734_784, available=9_513_345_024, percent=44.3, free=9_513_345_024)
+SWAP_MEM = SwapMemory(total=2_147_483_648, percent=3.1, free=2_080_374_784)
+CPU_INFO = {
+    'freq': {'min': 0.0, 'max': 3600.0, 'current': 2894.5},
+    'percent': {'core': [12.0, 4.5, 7.1, 3.0], 'total': 6.6},
+    'histograms': {'cpu_percent': "▁▁▂▁▃▁▁▁"}
+}
+
+
+def memory_snapshot(tick: int) -> tuple[VirtualMemory, SwapMemory]:
+    # Free memory changes between ticks, whereas total memory stays the same
+    free = VIRTUAL_MEM.free + tick * 4096
+    return VIRTUAL_MEM._replace(free=free, available=free), SWAP_MEM._replace(free=SWAP_MEM.free - tick * 4096)
+
+
+def legacy_memory(label: str, tick: int) -> str:
+    from humanize import naturalsize
+
+    virtual_mem, swap_mem = memory_snapshot(tick)
+    for fmt_str, value in [
+        ("{virtual_mem_free}", naturalsize(virtual_mem.free)),
+        ("{virtual_mem_percent}", virtual_mem.percent),
+        ("{virtual_mem_total}", naturalsize(virtual_mem.total)),
+        ("{virtual_mem_avail}", naturalsize(virtual_mem.available)),
+        ("{swap_mem_free}", naturalsize(swap_mem.free)),
+        ("{swap_mem_percent}", swap_mem.percent),
+        ("{swap_mem_total}", naturalsize(swap_mem.total)),
+    ]:
+        label = label.replace(fmt_str, str(value))
+    return label
+
+
+def compiled_memory(label_template, tick: int) -> str:
+    from core.widgets.yasb.memory import MEMORY_LABEL_OPTIONS
+
+    # Like the widget, only the options referenced by the label are formatted
+    virtual_mem, swap_mem = memory_snapshot(tick)
+    return label_template.render(**{
+        option: get_option_value(virtual_mem, swap_mem)
+        for option, get_option_value in MEMORY_LABEL_OPTIONS.items()
+        if option in label_template.field_names
+    })
+
+
+def legacy_traffic(label: str, tick: int) -> str:
+    from humanize import naturalsize
+
+    for option, value in [
+        ("{upload_speed}", naturalsize(48_213 + tick) + "/s"),
+        ("{download_speed}", naturalsize(1_532_112 + tick) + "/s"),
+    ]:
+        label = label.replace(option, str(value))
+    return label
+
+
+def compiled_traffic(label_template, tick: int) -> str:
+    from core.utils.label_template import format_size
+
+    return label_template.render(
+        upload_speed=format_size(48_213 + tick) + "/s",
+        download_speed=format_size(1_532_112 + tick) + "/s"
+    )
+
+
+def legacy_cpu(label: str, _tick: int) -> str:
+    return label.format(info=CPU_INFO)
+
+
+def compiled_cpu(label_template, _tick: int) -> str:
+    return label_template.render(info=CPU_INFO)
+
+
+def legacy_clock(label: str, _tick: int) -> str:
+    datetime_format_search = re.search('\\{(.*)}', label)
+    datetime_now = datetime.now()
+    return label.replace(datetime_format_search.group(), datetime_now.strftime(datetime_format_search.group(1)))
+
+
+def compiled_clock(label_template, _tick: int) -> str:
+    return label_template.render(datetime=datetime.now())
+
+
+BENCHMARKS = [
+    ('memory', " {virtual_mem_free}/{virtual_mem_total} ({virtual_mem_percent}%)", legacy_memory, compiled_memory),
+    ('traffic', "⬇ {download_speed} | ⬆ {upload_speed}", legacy_traffic, compiled_traffic),
+    ('cpu', " CPU: {info[percent][total]}% | freq: {info[freq][current]:.2f} Mhz", legacy_cpu, compiled_cpu),
+    ('clock', " {%d-%m-%y %H:%M:%S}", legacy_clock, compiled_clock)
+]
+
+
+def run_benchmark(name: str, label: str, legacy_fn, compiled_fn, number: int) -> dict:
+    from core.utils.label_template import compile_datetime_template, compile_template
+
+    # Widgets compile their labels once at construction, so compiling is not part of the measured cost
+    label_template = compile_datetime_template(label) if name == 'clock' else compile_template(label)
+
+    # Both implementations must produce the same label before their costs are compared
+    assert legacy_fn(label, 0) == compiled_fn(label_template, 0), f"{name} labels differ"
+
+    # Every render gets a new tick, which continues across repeats, so varying values are never cached
+    legacy_ticks, compiled_ticks = itertools.count(), itertools.count()
+    legacy_us = min(timeit.repeat(
+        lambda: legacy_fn(label, next(legacy_ticks)), number=number, repeat=3
+    )) / number * 1e6
+    compiled_us = min(timeit.repeat(
+        lambda: compiled_fn(label_template, next(compiled_ticks)), number=number, repeat=3
+    )) / number * 1e6
+
+    return {
+        'widget': name,
+        'legacy_us': legacy_us,
+        'compiled_us': compiled_us,
+        'speedup': legacy_us / compiled_us
+    }
+
+
+def print_table(results: list[dict]) -> None:
+    columns = [
+        ('widget', 'widget', '{}'),
+        ('legacy (us/tick)', 'legacy_us', '{:.2f}'),
+        ('compiled (us/tick)', 'compiled_us', '{:.2f}'),
+        ('speedup', 'speedup', '{:.1f}x')
+    ]
+    rows = [[fmt.format(result[key]) for _, key, fmt in columns] for result in results]
+    widths = [max(len(title), *(len(row[i]) for row in rows)) for i, (title, _, _) in enumerate(columns)]
+
+    print("  ".join(title.rjust(width) for (title, _, _), width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-tick label formatting of the built-in widgets.")
+    parser.add_argument("--number", type=int, default=20000, help="number of label renders per measurement")
+    parser.add_argument("--output", default="template_benchmark.json", help="path of the JSON results file")
+    args = parser.parse_args()
+
+    results = [
+        run_benchmark(name, label, legacy_fn, compiled_fn, args.number)
+        for name, label, legacy_fn, compiled_fn in BENCHMARKS
+    ]
+    print_table(results)
+
+    with open(args.output, 'w') as output_stream:
+        json.dump({
+            'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results
+        }, output_stream, indent=2)
+    print(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,12 @@ import logging
 from settings import APP_BAR_TITLE
 from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QGridLayout, QFrame
 from PyQt6.QtGui import QScreen
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtCore import Qt, QRect, QTimer
+from typing import Optional
 from core.utils.utilities import is_valid_percentage_str, percent_to_float
 from core.validation.bar import BAR_DEFAULTS
-from BlurWindow.blurWindow import GlobalBlur
+from core.utils.visibility import visibility_monitor
+from core.widgets.base import BaseWidget
 
 try:
     from core.utils.win32 import app_bar
@@ -20,7 +22,7 @@ class Bar(QWidget):
             bar_id: str,
             bar_name: str,
             bar_screen: QScreen,
-            stylesheet: str,
+            stylesheet: Optional[str],
             widgets: dict[str, list],
             init: bool = False,
             class_name: str = BAR_DEFAULTS['class_name'],
@@ -28,7 +30,8 @@ class Bar(QWidget):
             blur_effect: dict = BAR_DEFAULTS['blur_effect'],
             window_flags: dict = BAR_DEFAULTS['window_flags'],
             dimensions: dict = BAR_DEFAULTS['dimensions'],
-            padding: dict = BAR_DEFAULTS['padding']
+            padding: dict = BAR_DEFAULTS['padding'],
+            progressive_build: dict = BAR_DEFAULTS['progressive_build']
     ):
         super().__init__()
         self.hide()
@@ -40,6 +43,12 @@ class Bar(QWidget):
         self._window_flags = window_flags
         self._dimensions = dimensions
         self._padding = padding
+        self._widgets: dict[str, list] = {}
+        self._widget_layouts: dict[str, QHBoxLayout] = {}
+        self._progressive_build = progressive_build
+        self._pending_widgets: dict[QWidget, tuple[str, object]] = {}
+        self._pending_widget_queue: list[QWidget] = []
+        self._is_occluded = False
 
         self.screen_name = self.screen().name()
         self.app_bar_edge = app_bar.AppBarEdge.Top \
@@ -52,7 +61,13 @@ class Bar(QWidget):
             self.app_bar_manager = None
 
         self.setWindowTitle(APP_BAR_TITLE)
-        self.setStyleSheet(stylesheet)
+
+        if stylesheet is None:
+            # The stylesheet is applied application-wide, scoped to descendants of the bar class name
+            self.setProperty("class", class_name)
+        else:
+            self.setStyleSheet(stylesheet)
+
         self.setWindowFlag(Qt.WindowType.Tool)
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -67,6 +82,7 @@ class Bar(QWidget):
         self.position_bar(init)
 
         if blur_effect['enabled']:
+            from BlurWindow.blurWindow import GlobalBlur
             GlobalBlur(
                 self.winId(),
                 Acrylic=blur_effect['acrylic'],
@@ -77,10 +93,39 @@ class Bar(QWidget):
         self.screen().geometryChanged.connect(self.on_geometry_changed, Qt.ConnectionType.QueuedConnection)
         self.show()
 
+        visibility_monitor.changed.connect(self._on_visibility_changed)
+        visibility_monitor.start()
+
+        if self._pending_widget_queue:
+            QTimer.singleShot(0, self._build_pending_widgets_chunk)
+
     @property
     def bar_id(self) -> str:
         return self._bar_id
 
+    @property
+    def bar_name(self) -> str:
+        return self._bar_name
+
+    @property
+    def widgets(self) -> dict[str, list]:
+        return {
+            layout_type: [widget for widget in widgets if widget not in self._pending_widgets]
+            for layout_type, widgets in self._widgets.items()
+        }
+
+    @property
+    def event_listeners(self) -> set:
+        event_listeners = set()
+
+        for widgets in self._widgets.values():
+            for widget in widgets:
+                widget_source = self._pending_widgets[widget][1] if widget in self._pending_widgets else widget
+                if widget_source.event_listener:
+                    event_listeners.add(widget_source.event_listener)
+
+        return event_listeners
+
     def on_geometry_changed(self, geo: QRect) -> None:
         logging.info(f"Screen geometry changed. Updating position for bar ({self.bar_id})")
         self.position_bar()
@@ -156,16 +201,105 @@ class Bar(QWidget):
             if layout_type in ["center", "right"]:
                 layout.addStretch()
 
-            for widget in widgets[layout_type]:
-                widget.setFixedHeight(self._bar_frame.geometry().height())
-                widget.parent_layout_type = layout_type
-                widget.bar_id = self.bar_id
+            layout_widgets = [self._reserve_widget(widget, layout_type) for widget in widgets[layout_type]]
+
+            for widget in layout_widgets:
+                self._prepare_widget(widget, layout_type)
                 layout.addWidget(widget, 0)
 
             if layout_type in ["left", "center"]:
                 layout.addStretch()
 
+            self._widgets[layout_type] = layout_widgets
+            self._widget_layouts[layout_type] = layout
             layout_container.setLayout(layout)
             bar_layout.addWidget(layout_container, 0, column_num)
 
         self._bar_frame.setLayout(bar_layout)
+
+    def _reserve_widget(self, widget, layout_type: str) -> QWidget:
+        # Widget factories are reserved in the layout by an empty placeholder until they are built
+        if isinstance(widget, QWidget):
+            return widget
+
+        placeholder = QWidget()
+        self._pending_widgets[placeholder] = (layout_type, widget)
+        self._pending_widget_queue.append(placeholder)
+        return placeholder
+
+    def _build_pending_widgets_chunk(self) -> None:
+        for _ in range(self._progressive_build['chunk_size']):
+            if not self._pending_widget_queue:
+                break
+            self._build_pending_widget(self._pending_widget_queue.pop(0))
+
+        if self._pending_widget_queue:
+            QTimer.singleShot(0, self._build_pending_widgets_chunk)
+        else:
+            logging.info(f"Finished progressively building widgets for bar ({self.bar_id})")
+
+    def _build_pending_widget(self, placeholder: QWidget) -> None:
+        layout_type, widget_factory = self._pending_widgets.pop(placeholder)
+        layout = self._widget_layouts[layout_type]
+        layout_widgets = self._widgets[layout_type]
+        widget = widget_factory.build()
+
+        if widget:
+            self._prepare_widget(widget, layout_type)
+            layout.replaceWidget(placeholder, widget)
+            layout_widgets[layout_widgets.index(placeholder)] = widget
+        else:
+            layout.removeWidget(placeholder)
+            layout_widgets.remove(placeholder)
+
+        placeholder.deleteLater()
+
+    def build_pending_widgets(self) -> None:
+        while self._pending_widget_queue:
+            self._build_pending_widget(self._pending_widget_queue.pop(0))
+
+    def _prepare_widget(self, widget: QWidget, layout_type: str) -> None:
+        widget.setFixedHeight(self._bar_frame.geometry().height())
+        widget.parent_layout_type = layout_type
+        widget.bar_id = self.bar_id
+
+        if self._is_occluded and isinstance(widget, BaseWidget):
+            widget.suspend_timer("occluded")
+
+    def _on_visibility_changed(self) -> None:
+        is_occluded = visibility_monitor.is_window_occluded(int(self.winId()), self._window_flags['always_on_top'])
+
+        if is_occluded == self._is_occluded:
+            return
+
+        self._is_occluded = is_occluded
+        logging.info(f"Bar ({self.bar_id}) is {'occluded' if is_occluded else 'visible'}. Updating widget timers")
+
+        for widgets in self.widgets.values():
+            for widget in widgets:
+                if not isinstance(widget, BaseWidget):
+                    continue
+                elif is_occluded:
+                    widget.suspend_timer("occluded")
+                else:
+                    widget.resume_timer("occluded")
+
+    def set_layout_widgets(self, layout_type: str, widgets: list) -> None:
+        """
+        Replaces the widgets of a single left/center/right layout. Widgets which are present in both the
+        current and new lists are kept alive, whereas widgets which are no longer present are deleted.
+        """
+        layout = self._widget_layouts[layout_type]
+        layout_offset = 1 if layout_type in ["center", "right"] else 0
+
+        for old_widget in self._widgets[layout_type]:
+            layout.removeWidget(old_widget)
+            if old_widget not in widgets:
+                old_widget.hide()
+                old_widget.deleteLater()
+
+        for widget_index, widget in enumerate(widgets):
+            self._prepare_widget(widget, layout_type)
+            layout.insertWidget(layout_offset + widget_index, widget, 0)
+
+        self._widgets[layout_type] = list(widgets)
@@ -6,9 +6,14 @@ from PyQt6.QtGui import QScreen
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from core.bar import Bar
 from core.utils.widget_builder import WidgetBuilder
+from core.utils.widget_registry import get_widget_type, widget_options_cache
 from core.utils.utilities import get_screen_by_name
 from core.event_service import EventService
-from core.config import get_stylesheet, get_config
+from core.config import get_stylesheet, get_stylesheet_scope, get_config
+from core.utils.config_diff import ConfigDiff, diff_config
+from core.utils.profiler import startup_profiler
+from core.utils.power import power_monitor
+from core.utils.process_runner import process_runner
 from copy import deepcopy
 
 
@@ -23,41 +28,69 @@ class BarManager(QObject):
         self.event_service = EventService()
         self.widget_event_listeners = set()
         self.bars: list[Bar] = list()
-        self.config['bars'] = {n: bar for n, bar in self.config['bars'].items() if bar['enabled']}
+        self.config['bars'] = self._get_enabled_bars(self.config)
         self._threads = {}
         self._active_listeners = {}
         self._widget_builder = WidgetBuilder(self.config['widgets'])
         self._prev_listeners = set()
+        power_monitor.configure(self.config['low_power_mode'])
+        process_runner.configure(self.config['max_concurrent_processes'])
+
+        if self.uses_application_stylesheet:
+            QApplication.instance().setStyleSheet(self.stylesheet)
 
         self.styles_modified.connect(self.on_styles_modified)
         self.config_modified.connect(self.on_config_modified)
         QApplication.instance().screenAdded.connect(self.on_screens_update)
         QApplication.instance().screenRemoved.connect(self.on_screens_update)
 
+    @property
+    def uses_application_stylesheet(self) -> bool:
+        return self.config['application_stylesheet']
+
     @pyqtSlot()
     def on_styles_modified(self):
-        stylesheet = get_stylesheet(show_error_dialog=True)
+        stylesheet = get_stylesheet(show_error_dialog=True, scope_class_names=get_stylesheet_scope(self.config))
 
         if stylesheet and (stylesheet != self.stylesheet):
             self.stylesheet = stylesheet
+            self.apply_stylesheet()
+            logging.info("Successfully loaded updated stylesheet and applied to all bars.")
+
+    def apply_stylesheet(self) -> None:
+        if self.uses_application_stylesheet:
+            QApplication.instance().setStyleSheet(self.stylesheet)
+        else:
             for bar in self.bars:
                 bar.setStyleSheet(self.stylesheet)
-            logging.info("Successfully loaded updated stylesheet and applied to all bars.")
 
     @pyqtSlot()
     def on_config_modified(self):
         config = get_config(show_error_dialog=True)
 
+        if config:
+            config['bars'] = self._get_enabled_bars(config)
+
         if config and (config != self.config):
+            config_diff = diff_config(self.config, config)
+            stylesheet_scope_changed = get_stylesheet_scope(config) != get_stylesheet_scope(self.config)
+            self.config = config
+            widget_options_cache.prune(self.config['widgets'])
+            power_monitor.configure(self.config['low_power_mode'])
+            process_runner.configure(self.config['max_concurrent_processes'])
 
-            if config['bars'] != self.config['bars'] or config['widgets'] != self.config['widgets']:
-                self.config = config
-                self.close_bars()
-                self.initialize_bars()
+            if stylesheet_scope_changed:
+                self._reload_stylesheet_scope()
+                logging.info("Successfully loaded updated config and re-initialised all bars with re-scoped stylesheet.")
+            elif config_diff.requires_rebuild:
+                self.apply_config_diff(config_diff)
+                logging.info(
+                    f"Successfully loaded updated config. Rebuilt bar(s) {sorted(config_diff.bars_to_create)}, "
+                    f"closed bar(s) {sorted(config_diff.bars_to_close)} "
+                    f"and rebuilt widget(s) {sorted(config_diff.widgets_changed)}."
+                )
             else:
-                self.config = config
-
-            logging.info("Successfully loaded updated config and re-initialised all bars.")
+                logging.info("Successfully loaded updated config. No bars or widgets required rebuilding.")
 
     @pyqtSlot(QScreen)
     def on_screens_update(self, _screen: QScreen) -> None:
@@ -65,20 +98,121 @@ class BarManager(QObject):
         self.close_bars()
         self.initialize_bars()
 
-    def run_listeners_in_threads(self):
-        for listener in self.widget_event_listeners:
-            logging.info(f"Starting {listener.__name__}...")
+    def _reload_stylesheet_scope(self) -> None:
+        stylesheet = get_stylesheet(show_error_dialog=True, scope_class_names=get_stylesheet_scope(self.config))
+
+        if stylesheet:
+            self.stylesheet = stylesheet
+
+        QApplication.instance().setStyleSheet(self.stylesheet if self.uses_application_stylesheet else "")
+        self.close_bars()
+        self.initialize_bars()
+
+    @staticmethod
+    def _get_enabled_bars(config: dict) -> dict:
+        return {n: bar for n, bar in config['bars'].items() if bar['enabled']}
+
+    def apply_config_diff(self, config_diff: ConfigDiff) -> None:
+        """
+        Rebuilds only the bars whose config has changed, and replaces only the changed widgets within
+        all other bars. Listener threads are only restarted if widgets depending on them were rebuilt.
+        """
+        self._widget_builder = WidgetBuilder(self.config['widgets'])
+        rebuilt_widgets = []
+
+        for bar in [bar for bar in self.bars if bar.bar_name in config_diff.bars_to_close]:
+            bar.close()
+            self.bars.remove(bar)
+
+        for bar in self.bars:
+            rebuilt_widgets += self._rebuild_bar_widgets(bar, config_diff.widgets_changed)
+
+        for bar_name in config_diff.bars_to_create:
+            self.create_bars(bar_name, self.config['bars'][bar_name])
+
+        rebuilt_listeners = {widget.event_listener for widget in rebuilt_widgets if widget.event_listener}
+
+        for bar in self.bars:
+            if bar.bar_name in config_diff.bars_to_create:
+                rebuilt_listeners |= bar.event_listeners
+        self.sync_listener_threads(restart_listeners=rebuilt_listeners)
+        self._widget_builder.raise_alerts_if_errors_present()
+        self._log_widget_build_stats()
+
+    def _log_widget_build_stats(self) -> None:
+        options_stats = widget_options_cache.stats
+        logging.info(
+            f"Widget options cache: {options_stats['hits']} hit(s), {options_stats['misses']} miss(es), "
+            f"{options_stats['entries']} entries. Widget type registry: {get_widget_type.cache_info()}"
+        )
+
+    def _rebuild_bar_widgets(self, bar: Bar, widget_names: set[str]) -> list:
+        rebuilt_widgets = []
+        bar_widget_names = self.config['bars'][bar.bar_name]['widgets']
+        bar.build_pending_widgets()
+
+        for layout_type, bar_widgets in bar.widgets.items():
+            layout_widget_names = bar_widget_names.get(layout_type, [])
+
+            if not widget_names.intersection(layout_widget_names):
+                continue
+
+            existing_widgets = {}
+            for widget in bar_widgets:
+                existing_widgets.setdefault(widget.widget_name, []).append(widget)
+
+            layout_widgets = []
+            for widget_name in layout_widget_names:
+                if widget_name in widget_names:
+                    widget = self._widget_builder.build_widget(widget_name)
+                    if widget:
+                        rebuilt_widgets.append(widget)
+                elif existing_widgets.get(widget_name):
+                    widget = existing_widgets[widget_name].pop(0)
+                else:
+                    widget = None
+
+                if widget:
+                    layout_widgets.append(widget)
+
+            bar.set_layout_widgets(layout_type, layout_widgets)
+
+        return rebuilt_widgets
+
+    def sync_listener_threads(self, restart_listeners: set = None) -> None:
+        required_listeners = set().union(*[bar.event_listeners for bar in self.bars])
+        restart_listeners = (restart_listeners or set()) & required_listeners
+
+        for listener in (set(self._threads.keys()) - required_listeners) | restart_listeners:
+            self._stop_listener_thread(listener)
+
+        for listener in required_listeners - set(self._threads.keys()):
+            self._start_listener_thread(listener)
+
+        self.widget_event_listeners = required_listeners
+
+    def _start_listener_thread(self, listener) -> None:
+        logging.info(f"Starting {listener.__name__}...")
+        with startup_profiler.measure('listeners', listener.__name__):
             thread = listener()
             thread.start()
-            self._threads[listener] = thread
+        self._threads[listener] = thread
+
+    def _stop_listener_thread(self, listener) -> None:
+        logging.info(f"Stopping {listener.__name__}...")
+        with suppress(KeyError):
+            self._threads[listener].stop()
+            self._threads[listener].quit()
+            self._threads[listener].wait(500)
+            del self._threads[listener]
+
+    def run_listeners_in_threads(self):
+        for listener in self.widget_event_listeners:
+            self._start_listener_thread(listener)
 
     def stop_listener_threads(self):
         for listener in self.widget_event_listeners:
-            logging.info(f"Stopping {listener.__name__}...")
-            with suppress(KeyError):
-                self._threads[listener].stop()
-                self._threads[listener].quit()
-                self._threads[listener].wait(500)
+            self._stop_listener_thread(listener)
         self._threads.clear()
         self.widget_event_listeners.clear()
 
@@ -95,37 +229,45 @@ class BarManager(QObject):
         self._widget_builder = WidgetBuilder(self.config['widgets'])
 
         for bar_name, bar_config in self.config['bars'].items():
-
-            if bar_config['screens'] == ['*']:
-                for screen in QApplication.screens():
-                    self.create_bar(bar_config, bar_name, screen, init)
-                continue
-
-            for screen_name in bar_config['screens']:
-                screen = get_screen_by_name(screen_name)
-                if screen:
-                    self.create_bar(bar_config, bar_name, screen, init)
+            self.create_bars(bar_name, bar_config, init)
 
         self.run_listeners_in_threads()
         self._widget_builder.raise_alerts_if_errors_present()
+        self._log_widget_build_stats()
+
+    def create_bars(self, bar_name: str, bar_config: dict, init=False) -> None:
+        if bar_config['screens'] == ['*']:
+            for screen in QApplication.screens():
+                self.create_bar(bar_config, bar_name, screen, init)
+            return
+
+        for screen_name in bar_config['screens']:
+            screen = get_screen_by_name(screen_name)
+            if screen:
+                self.create_bar(bar_config, bar_name, screen, init)
 
     def create_bar(self, config: dict, name: str, screen: QScreen, init=False) -> None:
         screen_name = screen.name().replace('\\', '').replace('.', '')
         bar_id = f"{name}_{screen_name}_{str(uuid.uuid4())[:8]}"
         bar_config = deepcopy(config)
-        bar_widgets, widget_event_listeners = self._widget_builder.build_widgets(bar_config.get('widgets', {}))
-        bar_options = {
-            **bar_config,
-            'bar_id': bar_id,
-            'bar_name': name,
-            'bar_screen': screen,
-            'stylesheet': self.stylesheet,
-            'widgets': bar_widgets,
-            'init': init
-        }
-
-        del bar_options['enabled']
-        del bar_options['screens']
-
-        self.widget_event_listeners = self.widget_event_listeners.union(widget_event_listeners)
-        self.bars.append(Bar(**bar_options))
+
+        with startup_profiler.measure('bars', f"{name} ({screen.name()})"):
+            if bar_config['progressive_build']['enabled']:
+                bar_widgets, widget_event_listeners = self._widget_builder.get_widget_factories(bar_config['widgets'])
+            else:
+                bar_widgets, widget_event_listeners = self._widget_builder.build_widgets(bar_config['widgets'])
+            bar_options = {
+                **bar_config,
+                'bar_id': bar_id,
+                'bar_name': name,
+                'bar_screen': screen,
+                'stylesheet': None if self.uses_application_stylesheet else self.stylesheet,
+                'widgets': bar_widgets,
+                'init': init
+            }
+
+            del bar_options['enabled']
+            del bar_options['screens']
+
+            self.widget_event_listeners = self.widget_event_listeners.union(widget_event_listeners)
+            self.bars.append(Bar(**bar_options))
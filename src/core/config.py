@@ -1,15 +1,13 @@
+import functools
 import logging
 import settings
 from os import path
 from sys import argv, exit
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 from core.validation.config import CONFIG_SCHEMA
 from core.utils.alert_dialog import raise_info_alert
-from cssutils import CSSParser
-from cerberus import Validator, schema
-from yaml.parser import ParserError
-from yaml import safe_load, dump
+from core.utils.cache import FileCache, hash_bytes, hash_json
 from xml.dom import SyntaxErr
 
 
@@ -21,6 +19,9 @@ DEFAULT_STYLES_PATH = path.normpath(path.join(SRC_CONFIGURATION_DIR, settings.DE
 DEFAULT_CONFIG_PATH = path.normpath(path.join(SRC_CONFIGURATION_DIR, settings.DEFAULT_CONFIG_FILENAME))
 GITHUB_ISSUES_URL = f"{settings.GITHUB_URL}/issues"
 
+# CONFIG_SCHEMA embeds BAR_SCHEMA, so any change to either invalidates previously cached configs
+CONFIG_SCHEMA_VERSION = hash_json(CONFIG_SCHEMA)
+
 
 class ConfigValidationError(TypeError):
     def __init__(self, message: str, errors: str, filetype: str, filepath: str):
@@ -30,10 +31,11 @@ class ConfigValidationError(TypeError):
         self.filepath = filepath
 
 
-try:
-    yaml_validator = Validator(CONFIG_SCHEMA)
-except schema.SchemaError:
-    logging.exception("Failed to load configuration schema for yaml validator.")
+@functools.lru_cache(maxsize=None)
+def get_config_validator():
+    # cerberus is only imported when a config has to be validated, i.e. on config cache misses
+    from cerberus import Validator
+    return Validator(CONFIG_SCHEMA)
 
 
 def get_config_dir() -> str:
@@ -57,39 +59,104 @@ def get_stylesheet_path() -> str:
         return DEFAULT_STYLES_PATH
 
 
+def get_cache_dir() -> str:
+    return path.join(get_config_dir(), settings.DEFAULT_CACHE_DIRECTORY)
+
+
 def get_config(show_error_dialog=False) -> Union[dict, None]:
     config_path = get_config_path()
 
     try:
-        with open(config_path) as yaml_stream:
-            config = safe_load(yaml_stream)
-
-        if yaml_validator.validate(config, CONFIG_SCHEMA):
-            return yaml_validator.normalized(config)
-        else:
-            pretty_errors = dump(yaml_validator.errors)
-            logging.error(f"The config file '{config_path}' contains validation errors. Please fix:\n{pretty_errors}")
-            if show_error_dialog:
-                raise_info_alert(
-                    title="Failed to load recently updated config file.",
-                    msg=f"The file '{config_path}' contains validation error(s) and has not been loaded.",
-                    informative_msg="For more information, click 'Show Details'.",
-                    additional_details=pretty_errors
-                )
-    except ParserError as e:
-        logging.error(f"The file '{config_path}' contains Parser Error(s). Please fix:\n{str(e)}")
+        with open(config_path, 'rb') as yaml_stream:
+            config_bytes = yaml_stream.read()
+
+        config_cache = FileCache(get_cache_dir(), "config")
+        config_cache_key = f"{hash_bytes(config_bytes)}:{CONFIG_SCHEMA_VERSION}"
+        cached_config = config_cache.get(config_cache_key)
+
+        if cached_config is not None:
+            logging.info(f"Config cache hit for '{config_path}'. Skipped parsing and validation.")
+            return cached_config
+
+        normalized_config = _parse_config(config_path, config_bytes, show_error_dialog)
+
+        if normalized_config and config_cache.set(config_cache_key, normalized_config):
+            logging.info(f"Config cache miss for '{config_path}'. Cached validated config.")
+
+        return normalized_config
     except FileNotFoundError:
         logging.error(f"The file '{config_path}' could not be found. Does it exist?")
     except OSError:
         logging.error(f"The file '{config_path}' could not be read. Do you have read/write permissions?")
 
 
-def get_stylesheet(show_error_dialog=False) -> Union[str, None]:
+def _parse_config(config_path: str, config_bytes: bytes, show_error_dialog=False) -> Union[dict, None]:
+    from yaml import safe_load, dump
+    from yaml.parser import ParserError
+
+    try:
+        config = safe_load(config_bytes)
+    except ParserError as e:
+        logging.error(f"The file '{config_path}' contains Parser Error(s). Please fix:\n{str(e)}")
+        return None
+
+    yaml_validator = get_config_validator()
+
+    if yaml_validator.validate(config, CONFIG_SCHEMA):
+        return yaml_validator.normalized(config)
+
+    pretty_errors = dump(yaml_validator.errors)
+    logging.error(f"The config file '{config_path}' contains validation errors. Please fix:\n{pretty_errors}")
+    if show_error_dialog:
+        raise_info_alert(
+            title="Failed to load recently updated config file.",
+            msg=f"The file '{config_path}' contains validation error(s) and has not been loaded.",
+            informative_msg="For more information, click 'Show Details'.",
+            additional_details=pretty_errors
+        )
+
+
+def get_stylesheet_scope(config: dict) -> Optional[list[str]]:
+    if config['application_stylesheet']:
+        return sorted({bar['class_name'] for bar in config['bars'].values() if bar['enabled']})
+
+
+def _scope_stylesheet_rules(stylesheet, scope_class_names: list[str]) -> None:
+    # Prefixes every selector with each bar class name so application-wide styles only match bar descendants
+    for rule in stylesheet.cssRules:
+        if rule.type == rule.STYLE_RULE:
+            rule.selectorText = ", ".join([
+                f".{class_name} {selector.selectorText}"
+                for class_name in scope_class_names for selector in rule.selectorList
+            ])
+
+
+def get_stylesheet(show_error_dialog=False, scope_class_names: list[str] = None) -> Union[str, None]:
     styles_path = get_stylesheet_path()
 
     try:
+        with open(styles_path, 'rb') as styles_stream:
+            styles_bytes = styles_stream.read()
+
+        styles_cache = FileCache(get_cache_dir(), "stylesheet")
+        styles_cache_key = f"{hash_bytes(styles_bytes)}:{hash_json(scope_class_names)}"
+        cached_stylesheet = styles_cache.get(styles_cache_key)
+
+        if cached_stylesheet is not None:
+            logging.info(f"Stylesheet cache hit for '{styles_path}'. Skipped parsing.")
+            return cached_stylesheet
+
+        # cssutils is only imported when the stylesheet has to be parsed, i.e. on stylesheet cache misses
+        from cssutils import CSSParser
         parser = CSSParser(raiseExceptions=True)
-        return parser.parseFile(styles_path).cssText.decode('utf-8')
+        parsed_stylesheet = parser.parseString(styles_bytes, href=styles_path)
+
+        if scope_class_names:
+            _scope_stylesheet_rules(parsed_stylesheet, scope_class_names)
+
+        stylesheet = parsed_stylesheet.cssText.decode('utf-8')
+        styles_cache.set(styles_cache_key, stylesheet)
+        return stylesheet
     except SyntaxErr as e:
         logging.error(f"The file '{styles_path}' contains Syntax Error(s). Please fix:\n{str(e)}")
         if show_error_dialog:
@@ -107,7 +174,7 @@ def get_stylesheet(show_error_dialog=False) -> Union[str, None]:
 
 def get_config_and_stylesheet() -> tuple[dict, str]:
     config = get_config()
-    stylesheet = get_stylesheet()
+    stylesheet = get_stylesheet(scope_class_names=get_stylesheet_scope(config)) if config else None
 
     if not config:
         error_msg = "User config file could not be loaded. Exiting Application."
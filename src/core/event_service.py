@@ -2,7 +2,7 @@ import functools
 import logging
 
 from PyQt6.QtCore import QObject, pyqtSignal
-from typing import Any
+from typing import Any, Optional
 from core.event_enums import Event
 
 
@@ -12,18 +12,31 @@ class EventService(QObject):
         super().__init__()
         self._registered_event_signals: dict[Event, list[pyqtSignal]] = {}
 
-    def register_event(self, event_type: Event, event_signal: pyqtSignal):
+    def register_event(self, event_type: Event, event_signal: pyqtSignal, owner: Optional[QObject] = None):
+        """
+        Emits the signal on every event of the given type. Signals of an owner, e.g. the widget declaring them,
+        are unregistered once the owner is destroyed, so widgets replaced on config reloads stop receiving events.
+        """
         if event_type not in self._registered_event_signals:
             self._registered_event_signals[event_type] = [event_signal]
         else:
             self._registered_event_signals[event_type].append(event_signal)
 
+        if owner is not None:
+            owner.destroyed.connect(lambda: self.unregister_event(event_type, event_signal))
+
+    def unregister_event(self, event_type: Event, event_signal: pyqtSignal):
+        event_signals = self._registered_event_signals.get(event_type, [])
+
+        if event_signal in event_signals:
+            event_signals.remove(event_signal)
+
     def emit_event(self, event_type: Event, *args: Any):
         event_signals = self._registered_event_signals.get(event_type, [])
-        for event_signal in event_signals:
+        for event_signal in list(event_signals):
             try:
                 event_signal.emit(*args)
-            except AttributeError:
+            except (AttributeError, RuntimeError):
                 logging.error(f"Failed to emit signal {event_signal.__str__()}. Removing link to {event_type}.")
                 event_signals.pop(event_signals.index(event_signal))
 
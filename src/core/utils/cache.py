@@ -0,0 +1,60 @@
+import json
+import pickle
+import hashlib
+import logging
+from os import path, makedirs, replace
+from typing import Any, Optional
+
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_json(obj: Any) -> str:
+    return hash_bytes(json.dumps(obj, sort_keys=True, default=str).encode('utf-8'))
+
+
+class FileCache:
+    """
+    A single-entry cache pickled to disk. The entry is only returned if the key it was stored with
+    matches the key requested, e.g. a hash of the source file contents and its schema version.
+    """
+
+    def __init__(self, cache_dir: str, cache_name: str):
+        self._cache_path = path.join(cache_dir, f"{cache_name}.cache")
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._cache_path, 'rb') as cache_stream:
+                cache_entry = pickle.load(cache_stream)
+
+            if cache_entry['version'] == CACHE_FORMAT_VERSION and cache_entry['key'] == key:
+                return cache_entry['value']
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, AttributeError):
+            logging.warning(f"Ignoring unreadable cache file '{self._cache_path}'")
+
+    def set(self, key: str, value: Any) -> bool:
+        cache_entry = {'version': CACHE_FORMAT_VERSION, 'key': key, 'value': value}
+        tmp_cache_path = f"{self._cache_path}.tmp"
+
+        try:
+            makedirs(path.dirname(self._cache_path), exist_ok=True)
+
+            with open(tmp_cache_path, 'wb') as cache_stream:
+                pickle.dump(cache_entry, cache_stream, protocol=pickle.HIGHEST_PROTOCOL)
+
+            replace(tmp_cache_path, self._cache_path)
+            return True
+        except pickle.PicklingError:
+            logging.warning(f"Value could not be serialized to cache file '{self._cache_path}'")
+        except OSError:
+            logging.warning(f"Failed to write cache file '{self._cache_path}'")
+        return False
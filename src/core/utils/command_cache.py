@@ -0,0 +1,152 @@
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QObject, pyqtSlot
+from core.utils.command_runner import CommandRunner, TaskRunner
+from core.utils.data_provider import ProviderRunner
+from core.utils.subscribers import SubscriberRegistry
+from settings import COMMAND_CACHE_TTL_SLACK_MS
+
+
+class CommandCache(QObject):
+    """
+    Caches the parsed output of a command, or the result of a data provider, shared by all widgets running it
+    with the same options, so a command displayed on several screens or by several widgets is spawned and parsed
+    once per interval. The result is reused for the shortest run interval of the subscribers, measured from the
+    start of the run which produced it. Subscribers which run once accept any cached result. Subscribers requesting
+    a result while a run is in progress receive the result of that run.
+    """
+
+    def __init__(self, cache_key: tuple, runner: TaskRunner):
+        super().__init__()
+        self.cache_key = cache_key
+        self.data: Any = None
+        self.num_hits = 0
+        self.num_shared_runs = 0
+        self._fetched_at_ms: Optional[float] = None
+        self._run_started_at_ms: Optional[float] = None
+        self._subscribers: dict[int, tuple[Callable[[Any], None], int]] = {}
+        self._subscriber_registry = SubscriberRegistry(self._remove_subscriber)
+        self._pending_subscribers: dict[int, Callable[[Any], None]] = {}
+        self._runner = runner
+        self._runner.setParent(self)
+        self._runner.data_ready.connect(self._on_data)
+
+    @property
+    def num_subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def ttl(self) -> int:
+        intervals = [interval for _, interval in self._subscribers.values() if interval > 0]
+        return min(intervals) if intervals else 0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            **self._runner.stats,
+            'subscribers': self.num_subscribers,
+            'ttl': self.ttl,
+            'hits': self.num_hits,
+            'shared': self.num_shared_runs
+        }
+
+    def subscribe(self, subscriber: QObject, callback: Callable[[Any], None], interval: int) -> None:
+        """
+        Registers the subscriber's callback and run interval. The callback receives the parsed output of the
+        command each time the subscriber requests it, until the subscriber is unsubscribed or destroyed.
+        """
+        subscriber_id = self._subscriber_registry.add(subscriber)
+        self._subscribers[subscriber_id] = (callback, interval)
+
+    def unsubscribe(self, subscriber: QObject) -> None:
+        self._remove_subscriber(id(subscriber))
+
+    def request(self, subscriber: QObject) -> None:
+        subscriber_id = id(subscriber)
+        callback, interval = self._subscribers[subscriber_id]
+
+        if self._fetched_at_ms is not None and (interval == 0 or self._is_fresh()):
+            self.num_hits += 1
+            callback(self.data)
+            return
+
+        self._pending_subscribers[subscriber_id] = callback
+
+        if self._runner.is_running:
+            self.num_shared_runs += 1
+            return
+
+        self._run_started_at_ms = self._now_ms()
+        self._runner.run()
+
+    def _is_fresh(self) -> bool:
+        # The slack absorbs the jitter between ticks of subscribers sharing the same run interval. Subscribers
+        # which run once (interval 0) are left out of the TTL, so they never make cached results expire at once.
+        max_age_ms = self.ttl - COMMAND_CACHE_TTL_SLACK_MS
+        return self._now_ms() - self._fetched_at_ms < max_age_ms
+
+    def _now_ms(self) -> float:
+        return time.monotonic() * 1000
+
+    def _remove_subscriber(self, subscriber_id: int) -> None:
+        self._subscriber_registry.discard(subscriber_id)
+        self._pending_subscribers.pop(subscriber_id, None)
+
+        if self._subscribers.pop(subscriber_id, None) and not self._subscribers:
+            _command_caches.pop(self.cache_key, None)
+
+            # Subscribers may outlive the runner while the application shuts down
+            with suppress(RuntimeError):
+                self._runner.cancel()
+
+    @pyqtSlot(object)
+    def _on_data(self, data: Any) -> None:
+        self.data = data
+        self._fetched_at_ms = self._run_started_at_ms
+        pending_subscribers = list(self._pending_subscribers.items())
+        self._pending_subscribers.clear()
+
+        self._subscriber_registry.notify(pending_subscribers, self.data)
+
+
+_command_caches: dict[tuple, CommandCache] = {}
+
+
+def get_command_cache(cmd: list[str], return_format: str, timeout: int, max_output_size: int) -> CommandCache:
+    """
+    Returns the cache of the given command line, shared by all widgets running it with the same options.
+    Caches are discarded once their last subscriber is removed.
+    """
+    cache_key = ('cmd', tuple(cmd), return_format, timeout, max_output_size)
+    command_cache = _command_caches.get(cache_key)
+
+    if command_cache is None:
+        command_cache = CommandCache(cache_key, CommandRunner(cmd, return_format, timeout, max_output_size))
+        _command_caches[cache_key] = command_cache
+
+    return command_cache
+
+
+def get_provider_cache(provider_path: str, timeout: int) -> CommandCache:
+    """
+    Returns the cache of the given data provider, shared by all widgets calling it with the same timeout.
+    Caches are discarded once their last subscriber is removed.
+    """
+    cache_key = ('provider', provider_path, timeout)
+    provider_cache = _command_caches.get(cache_key)
+
+    if provider_cache is None:
+        provider_cache = CommandCache(cache_key, ProviderRunner(provider_path, timeout))
+        _command_caches[cache_key] = provider_cache
+
+    return provider_cache
+
+
+def get_command_cache_stats() -> list[dict]:
+    return [command_cache.stats for command_cache in _command_caches.values()]
+
+
+def log_command_cache_stats() -> None:
+    logging.info(f"Command caches: {get_command_cache_stats()}")
@@ -0,0 +1,191 @@
+import json
+import logging
+import subprocess
+import time
+from contextlib import suppress
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from core.utils.process_runner import get_command_pool, kill_process_tree, process_runner
+
+
+def parse_output(output: bytes, return_format: str) -> Any:
+    return json.loads(output) if return_format == "json" else output.decode('utf-8').strip()
+
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(int, object, bool, float)
+    failed = pyqtSignal(int, float)
+
+
+class _CommandTask(QRunnable):
+
+    def __init__(self, run_id: int, cmd: list[str], return_format: str, max_output_size: int):
+        super().__init__()
+        self.signals = TaskSignals()
+        self._run_id = run_id
+        self._cmd = cmd
+        self._return_format = return_format
+        self._max_output_size = max_output_size
+        self._process: Optional[subprocess.Popen] = None
+        self._is_cancelled = False
+
+    def cancel(self) -> None:
+        self._is_cancelled = True
+
+        if self._process is not None:
+            kill_process_tree(self._process)
+
+    def run(self) -> None:
+        start = time.perf_counter()
+
+        try:
+            with process_runner.spawn(self._cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=True) as process:
+                self._process = process
+
+                # The run may have been cancelled while waiting for a free process slot
+                if self._is_cancelled:
+                    kill_process_tree(process)
+
+                # Reading stops at the end of the output or once the output exceeds the cap, whichever comes first.
+                # Commands run by a shell are killed along with the shell, so the read ends once a run is cancelled.
+                with process.stdout:
+                    output = process.stdout.read(self._max_output_size + 1)
+                    is_truncated = len(output) > self._max_output_size
+
+                    if is_truncated:
+                        kill_process_tree(process)
+
+            # Output is parsed on the worker thread, so large JSON documents never block the GUI thread
+            data = parse_output(output[:self._max_output_size], self._return_format)
+        except Exception:
+            logging.exception(f"Failed to run command {self._cmd}")
+            self.signals.failed.emit(self._run_id, (time.perf_counter() - start) * 1000)
+        else:
+            self.signals.finished.emit(self._run_id, data, is_truncated, (time.perf_counter() - start) * 1000)
+
+
+class TaskRunner(QObject):
+    """
+    Runs a widget's data source on a worker thread and delivers its result back to the GUI thread. A run which
+    is still in progress is never overlapped by another one, so runs which take longer than the widget's interval
+    are skipped rather than piling up. Runs exceeding the timeout are cancelled and their result is discarded,
+    and new runs are skipped until the cancelled run has returned. The task of each run is created by the task
+    factory, which receives the id of the run.
+    """
+    data_ready = pyqtSignal(object)
+
+    def __init__(self, source: str, timeout: int, create_task: Callable[[int], QRunnable]):
+        super().__init__()
+        self.source = source
+        self.num_runs = 0
+        self.num_failed_runs = 0
+        self.num_skipped_runs = 0
+        self.num_timeouts = 0
+        self.num_truncated_outputs = 0
+        self.last_run_ms: Optional[float] = None
+        self.max_run_ms = 0.0
+        self._run_id = 0
+        self._create_task = create_task
+        self._task: Optional[QRunnable] = None
+        self._is_cancelled = False
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.setInterval(timeout)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'source': self.source,
+            'runs': self.num_runs,
+            'failed': self.num_failed_runs,
+            'skipped': self.num_skipped_runs,
+            'timeouts': self.num_timeouts,
+            'truncated': self.num_truncated_outputs,
+            'last_run_ms': round(self.last_run_ms, 2) if self.last_run_ms is not None else None,
+            'max_run_ms': round(self.max_run_ms, 2)
+        }
+
+    def run(self) -> None:
+        if self._task:
+            self.num_skipped_runs += 1
+            return
+
+        self._run_id += 1
+        self._is_cancelled = False
+        self._task = self._create_task(self._run_id)
+        self._task.signals.finished.connect(self._on_finished)
+        self._task.signals.failed.connect(self._on_failed)
+        self._timeout_timer.start()
+        self._get_pool().start(self._task)
+
+    def cancel(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._is_cancelled = True
+
+        # The runner may outlive its timer while the application shuts down
+        with suppress(RuntimeError):
+            self._timeout_timer.stop()
+
+    def _get_pool(self) -> QThreadPool:
+        return get_command_pool()
+
+    def _finish_run(self, run_id: int, duration_ms: float) -> bool:
+        if run_id != self._run_id:
+            return False
+
+        self._task = None
+        self._timeout_timer.stop()
+        self.last_run_ms = duration_ms
+        self.max_run_ms = max(self.max_run_ms, duration_ms)
+
+        # Results of runs which were cancelled or timed out are discarded
+        return not self._is_cancelled
+
+    @pyqtSlot(int, object, bool, float)
+    def _on_finished(self, run_id: int, data: Any, is_truncated: bool, duration_ms: float) -> None:
+        if not self._finish_run(run_id, duration_ms):
+            return
+
+        self.num_runs += 1
+
+        if is_truncated:
+            self.num_truncated_outputs += 1
+            logging.warning(f"Output of {self.source} was truncated")
+
+        self.data_ready.emit(data)
+
+    @pyqtSlot(int, float)
+    def _on_failed(self, run_id: int, duration_ms: float) -> None:
+        if self._finish_run(run_id, duration_ms):
+            self.num_failed_runs += 1
+
+    @pyqtSlot()
+    def _on_timeout(self) -> None:
+        self.num_timeouts += 1
+        logging.warning(
+            f"{self.source} exceeded {self._timeout_timer.interval()}ms timeout and was cancelled "
+            f"({self.num_timeouts} timeout(s) in {self.num_runs + self.num_timeouts} run(s))"
+        )
+        self.cancel()
+
+
+class CommandRunner(TaskRunner):
+    """
+    Runs a widget's command and parses its output. Commands exceeding the timeout are killed, and output beyond
+    the maximum output size is truncated.
+    """
+
+    def __init__(self, cmd: list[str], return_format: str, timeout: int, max_output_size: int):
+        super().__init__(f"Command {cmd}", timeout, self._create_command_task)
+        self.cmd = cmd
+        self.return_format = return_format
+        self.max_output_size = max_output_size
+
+    def _create_command_task(self, run_id: int) -> QRunnable:
+        return _CommandTask(run_id, self.cmd, self.return_format, self.max_output_size)
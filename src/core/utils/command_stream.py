@@ -0,0 +1,199 @@
+import logging
+import subprocess
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+from core.utils.command_runner import parse_output
+from core.utils.process_runner import kill_process_tree, process_runner
+from core.utils.subscribers import SubscriberRegistry
+from settings import COMMAND_STREAM_RESTART_DELAY_MS, COMMAND_STREAM_MAX_RESTART_DELAY_MS
+
+
+class CommandStream(QThread):
+    """
+    Runs a long-lived command and reads its output line by line on a dedicated thread, so widgets displaying
+    values printed by the command update as soon as a line arrives, without spawning a process per update.
+    Each line is parsed once and pushed to every subscribed widget. The command is restarted with an exponential
+    backoff whenever it exits, and the backoff is reset once the command stays up for the maximum delay.
+    """
+    data_ready = pyqtSignal(object)
+
+    def __init__(self, cmd: list[str], return_format: str, max_output_size: int):
+        super().__init__()
+        self.cmd = cmd
+        self.return_format = return_format
+        self.max_output_size = max_output_size
+        self.cache_key = _get_stream_key(cmd, return_format, max_output_size)
+        self.data: Any = None
+        self.has_data = False
+        self.num_starts = 0
+        self.num_lines = 0
+        self.num_failed_lines = 0
+        self.num_oversized_lines = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._stop_event = threading.Event()
+        self._subscribers: dict[int, Callable[[Any], None]] = {}
+        self._subscriber_registry = SubscriberRegistry(self._remove_subscriber)
+        self.data_ready.connect(self._on_data)
+
+        if QCoreApplication.instance():
+            QCoreApplication.instance().aboutToQuit.connect(self._on_about_to_quit)
+
+    @property
+    def num_subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'cmd': " ".join(self.cmd),
+            'format': self.return_format,
+            'subscribers': self.num_subscribers,
+            'starts': self.num_starts,
+            'lines': self.num_lines,
+            'failed': self.num_failed_lines,
+            'oversized': self.num_oversized_lines
+        }
+
+    def subscribe(self, subscriber: QObject, callback: Callable[[Any], None]) -> None:
+        """
+        Pushes the data parsed from every line to the callback until the subscriber is unsubscribed or destroyed.
+        The command is started by its first subscriber and stopped once its last subscriber is removed.
+        """
+        subscriber_id = self._subscriber_registry.add(subscriber)
+        self._subscribers[subscriber_id] = callback
+
+        if not self.isRunning() and not self._stop_event.is_set():
+            self.start()
+        elif self.has_data:
+            # New subscribers immediately receive the latest line instead of waiting for the next one
+            callback(self.data)
+
+    def unsubscribe(self, subscriber: QObject) -> None:
+        self._remove_subscriber(id(subscriber))
+
+    def stop(self) -> None:
+        """
+        Kills the command and returns without waiting for the stream's thread, which finishes once the command's
+        output is closed. Stopped streams are kept alive until their thread has finished.
+        """
+        self._stop_event.set()
+        self._kill_process()
+
+        if self.isRunning() and self not in _stopping_streams:
+            _stopping_streams.add(self)
+            self.finished.connect(lambda: _stopping_streams.discard(self))
+
+    def run(self) -> None:
+        restart_delay_ms = COMMAND_STREAM_RESTART_DELAY_MS
+
+        while not self._stop_event.is_set():
+            started_at = time.monotonic()
+            self._read_process_output()
+
+            if self._stop_event.is_set():
+                break
+
+            if (time.monotonic() - started_at) * 1000 >= COMMAND_STREAM_MAX_RESTART_DELAY_MS:
+                restart_delay_ms = COMMAND_STREAM_RESTART_DELAY_MS
+
+            logging.warning(f"Streaming command {self.cmd} exited. Restarting in {restart_delay_ms}ms")
+            self._stop_event.wait(restart_delay_ms / 1000)
+            restart_delay_ms = min(restart_delay_ms * 2, COMMAND_STREAM_MAX_RESTART_DELAY_MS)
+
+    def _read_process_output(self) -> None:
+        try:
+            self._process = process_runner.start(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=True)
+            self.num_starts += 1
+
+            if self._stop_event.is_set():
+                self._kill_process()
+
+            # Lines are read up to the output cap, and the remainder of longer lines is discarded
+            is_discarding = False
+
+            for line in iter(lambda: self._process.stdout.readline(self.max_output_size + 1), b""):
+                if is_discarding:
+                    is_discarding = not line.endswith(b"\n")
+                elif len(line.rstrip(b"\r\n")) > self.max_output_size:
+                    self.num_oversized_lines += 1
+                    logging.warning(f"Discarded line of streaming command {self.cmd} exceeding {self.max_output_size} bytes")
+                    is_discarding = not line.endswith(b"\n")
+                elif line.strip():
+                    self._parse_line(line)
+
+            self._process.stdout.close()
+            self._process.wait()
+        except Exception:
+            logging.exception(f"Failed to run streaming command {self.cmd}")
+
+    def _parse_line(self, line: bytes) -> None:
+        try:
+            data = parse_output(line, self.return_format)
+        except Exception:
+            self.num_failed_lines += 1
+            logging.warning(f"Failed to parse line of streaming command {self.cmd}: {line[:100]}")
+            return
+
+        self.num_lines += 1
+        self.data_ready.emit(data)
+
+    def _kill_process(self) -> None:
+        # Commands run by the shell are killed along with it, as they would otherwise keep the output pipe open
+        if self._process is not None:
+            kill_process_tree(self._process)
+
+    @pyqtSlot()
+    def _on_about_to_quit(self) -> None:
+        # The event loop has exited, so the thread is waited for briefly to finish before the application is destroyed
+        self.stop()
+        self.wait(500)
+
+    def _remove_subscriber(self, subscriber_id: int) -> None:
+        self._subscriber_registry.discard(subscriber_id)
+
+        if self._subscribers.pop(subscriber_id, None) and not self._subscribers:
+            _command_streams.pop(self.cache_key, None)
+
+            # Subscribers may outlive the stream's thread while the application shuts down
+            with suppress(RuntimeError):
+                self.stop()
+
+    @pyqtSlot(object)
+    def _on_data(self, data: Any) -> None:
+        self.data = data
+        self.has_data = True
+
+        self._subscriber_registry.notify(self._subscribers.items(), data)
+
+
+_command_streams: dict[tuple, CommandStream] = {}
+_stopping_streams: set[CommandStream] = set()
+
+
+def _get_stream_key(cmd: list[str], return_format: str, max_output_size: int) -> tuple:
+    return tuple(cmd), return_format, max_output_size
+
+
+def get_command_stream(cmd: list[str], return_format: str, max_output_size: int) -> CommandStream:
+    """
+    Returns the stream of the given command line, shared by all widgets streaming it with the same options.
+    Streams are stopped and discarded once their last subscriber is removed.
+    """
+    command_stream = _command_streams.get(_get_stream_key(cmd, return_format, max_output_size))
+
+    if command_stream is None:
+        command_stream = CommandStream(cmd, return_format, max_output_size)
+        _command_streams[command_stream.cache_key] = command_stream
+
+    return command_stream
+
+
+def get_command_stream_stats() -> list[dict]:
+    return [command_stream.stats for command_stream in _command_streams.values()]
+
+
+def log_command_stream_stats() -> None:
+    logging.info(f"Command streams: {get_command_stream_stats()}")
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ConfigDiff:
+    bars_added: set[str] = field(default_factory=set)
+    bars_removed: set[str] = field(default_factory=set)
+    bars_changed: set[str] = field(default_factory=set)
+    widgets_changed: set[str] = field(default_factory=set)
+
+    @property
+    def bars_to_close(self) -> set[str]:
+        return self.bars_removed | self.bars_changed
+
+    @property
+    def bars_to_create(self) -> set[str]:
+        return self.bars_added | self.bars_changed
+
+    @property
+    def requires_rebuild(self) -> bool:
+        return bool(self.bars_added or self.bars_removed or self.bars_changed or self.widgets_changed)
+
+
+def diff_config(old_config: dict, new_config: dict) -> ConfigDiff:
+    """
+    Compares two validated configs and maps the differences onto the bars which must be rebuilt
+    and the widget names whose instances must be replaced within the remaining bars.
+    """
+    old_bars, new_bars = old_config['bars'], new_config['bars']
+    old_widgets, new_widgets = old_config['widgets'], new_config['widgets']
+
+    return ConfigDiff(
+        bars_added=set(new_bars) - set(old_bars),
+        bars_removed=set(old_bars) - set(new_bars),
+        bars_changed={name for name in set(old_bars) & set(new_bars) if old_bars[name] != new_bars[name]},
+        widgets_changed={
+            name for name in set(old_widgets) | set(new_widgets) if old_widgets.get(name) != new_widgets.get(name)
+        }
+    )
@@ -0,0 +1,127 @@
+import functools
+import inspect
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from importlib import import_module
+from typing import Any, Awaitable, Callable
+from PyQt6.QtCore import QRunnable, QThreadPool
+from core.config import get_config_dir
+from core.utils.command_runner import TaskRunner, TaskSignals
+from settings import PROVIDER_POOL_MAX_THREADS
+
+
+@functools.lru_cache(maxsize=None)
+def load_data_provider(provider_path: str) -> Callable:
+    """
+    Resolves a data provider such as 'weather.get_weather' to the callable 'get_weather' of the module
+    'weather'. Modules are looked up in the yasb config directory after the regular import paths, so a
+    provider can be a plain Python file next to the config file.
+    """
+    module_path, provider_name = provider_path.rsplit('.', 1)
+    config_dir = get_config_dir()
+
+    if config_dir not in sys.path:
+        sys.path.append(config_dir)
+
+    provider = getattr(import_module(module_path), provider_name)
+
+    if not callable(provider):
+        raise TypeError(f"The data provider {provider_path} is not callable")
+
+    return provider
+
+
+@functools.lru_cache(maxsize=None)
+def get_provider_pool() -> QThreadPool:
+    # Providers cannot be interrupted, so stuck providers occupy threads of their own pool rather than the command pool
+    provider_pool = QThreadPool()
+    provider_pool.setMaxThreadCount(PROVIDER_POOL_MAX_THREADS)
+    return provider_pool
+
+
+async def _await_result(result: Awaitable) -> Any:
+    return await result
+
+
+# Number of cancelled runs of each provider which have not returned yet, including runs of discarded runners
+_stuck_runs: Counter[str] = Counter()
+_stuck_runs_lock = threading.Lock()
+
+
+def is_provider_stuck(provider_path: str) -> bool:
+    with _stuck_runs_lock:
+        return _stuck_runs[provider_path] > 0
+
+
+class _ProviderTask(QRunnable):
+
+    def __init__(self, run_id: int, provider_path: str):
+        super().__init__()
+        self.signals = TaskSignals()
+        self._run_id = run_id
+        self._provider_path = provider_path
+        self._is_cancelled = False
+        self._is_returned = False
+
+    def cancel(self) -> None:
+        # Providers cannot be interrupted, so the result of a cancelled run is discarded by its runner instead,
+        # and the provider is not called again until the run has returned
+        with _stuck_runs_lock:
+            if not self._is_cancelled and not self._is_returned:
+                self._is_cancelled = True
+                _stuck_runs[self._provider_path] += 1
+
+    def run(self) -> None:
+        try:
+            self._call_provider()
+        finally:
+            with _stuck_runs_lock:
+                self._is_returned = True
+
+                if self._is_cancelled:
+                    _stuck_runs[self._provider_path] -= 1
+
+    def _call_provider(self) -> None:
+        start = time.perf_counter()
+
+        try:
+            data = load_data_provider(self._provider_path)()
+
+            # Coroutines are run to completion in an event loop of their own on the worker thread
+            if inspect.isawaitable(data):
+                import asyncio
+                data = asyncio.run(_await_result(data))
+        except Exception:
+            logging.exception(f"Failed to call data provider {self._provider_path}")
+            self.signals.failed.emit(self._run_id, (time.perf_counter() - start) * 1000)
+        else:
+            self.signals.finished.emit(self._run_id, data, False, (time.perf_counter() - start) * 1000)
+
+
+class ProviderRunner(TaskRunner):
+    """
+    Calls a widget's in-process data provider, so cheap data sources cost a function call instead of a process.
+    Providers exceeding the timeout keep running until they return, but their result is discarded and runs of the
+    provider are skipped in the meantime, including runs of other runners. Providers run on a bounded pool of their
+    own, so stuck providers cannot delay commands.
+    """
+
+    def __init__(self, provider_path: str, timeout: int):
+        super().__init__(f"Data provider {provider_path}", timeout, self._create_provider_task)
+        self.provider_path = provider_path
+
+    def run(self) -> None:
+        if not self.is_running and is_provider_stuck(self.provider_path):
+            self.num_skipped_runs += 1
+            return
+
+        super().run()
+
+    def _create_provider_task(self, run_id: int) -> QRunnable:
+        return _ProviderTask(run_id, self.provider_path)
+
+    def _get_pool(self) -> QThreadPool:
+        return get_provider_pool()
@@ -0,0 +1,125 @@
+import logging
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from settings import DEFAULT_IMPORT_BUDGET_MS
+
+PROFILE_IMPORTS_ARG = "--profile-imports"
+NUM_REPORTED_IMPORTS = 15
+
+
+class _TimedLoader:
+    """
+    Wraps a module loader so executing the module is timed. Nested imports are timed by their own loaders,
+    which yields the same self/cumulative split as 'python -X importtime'.
+    """
+
+    def __init__(self, profiler: 'ImportProfiler', loader):
+        self._profiler = profiler
+        self._loader = loader
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler.push(module.__name__)
+
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.pop(module.__name__)
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Records the time spent importing each module after the profiler has been installed, e.g. via
+    --profile-imports, and reports the most expensive imports against the startup import budget.
+    """
+
+    def __init__(self, budget_ms: int = DEFAULT_IMPORT_BUDGET_MS):
+        self.enabled = False
+        self.budget_ms = budget_ms
+        self._stack: list[list] = []
+        self._timings: dict[str, dict] = {}
+
+    def install(self) -> None:
+        if not self.enabled:
+            self.enabled = True
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self.enabled:
+            self.enabled = False
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        # Delegates to the remaining finders and only wraps the loader of the spec they return
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(self, spec.loader)
+                return spec
+
+        return None
+
+    def push(self, module_name: str) -> None:
+        self._stack.append([module_name, time.perf_counter(), 0.0])
+
+    def pop(self, module_name: str) -> None:
+        _, start, children_ms = self._stack.pop()
+        cumulative_ms = (time.perf_counter() - start) * 1000
+        self._timings[module_name] = {
+            'self_ms': cumulative_ms - children_ms,
+            'cumulative_ms': cumulative_ms,
+            'top_level': not self._stack
+        }
+
+        if self._stack:
+            self._stack[-1][2] += cumulative_ms
+
+    @property
+    def total_ms(self) -> float:
+        return sum(timing['cumulative_ms'] for timing in self._timings.values() if timing['top_level'])
+
+    def report(self) -> dict:
+        return {
+            'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'budget_ms': self.budget_ms,
+            'total_ms': self.total_ms,
+            'num_modules': len(self._timings),
+            'modules': dict(sorted(self._timings.items(), key=lambda item: item[1]['cumulative_ms'], reverse=True))
+        }
+
+    def log_report(self) -> None:
+        report = self.report()
+        lines = [
+            f"Import profile: {report['num_modules']} module(s) imported in {report['total_ms']:.1f}ms "
+            f"(budget {report['budget_ms']}ms)",
+            f"  {'self (ms)':>10}  {'cumulative (ms)':>15}  module"
+        ]
+
+        for module_name, timing in list(report['modules'].items())[:NUM_REPORTED_IMPORTS]:
+            lines.append(f"  {timing['self_ms']:>10.1f}  {timing['cumulative_ms']:>15.1f}  {module_name}")
+
+        logging.info("\n".join(lines))
+
+        if report['total_ms'] > report['budget_ms']:
+            logging.warning(
+                f"Startup imports took {report['total_ms']:.1f}ms, "
+                f"exceeding the import budget of {report['budget_ms']}ms"
+            )
+
+
+import_profiler = ImportProfiler()
+
+# Installed on import so that the imports of main.py itself are profiled
+if PROFILE_IMPORTS_ARG in sys.argv:
+    import_profiler.install()
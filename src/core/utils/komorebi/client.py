@@ -1,8 +1,8 @@
 import subprocess
-import logging
 import json
 from contextlib import suppress
 from typing import Optional
+from core.utils.process_runner import process_runner
 
 
 def add_index(dictionary: dict, dictionary_index: int) -> dict:
@@ -23,7 +23,7 @@ class KomorebiClient:
 
     def query_state(self) -> Optional[dict]:
         with suppress(json.JSONDecodeError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            output = subprocess.check_output([self._komorebic_path, "state"], timeout=self._timeout_secs, shell=True)
+            output = process_runner.check_output([self._komorebic_path, "state"], timeout=self._timeout_secs, shell=True)
             return json.loads(output)
 
     def get_screens(self, state: dict) -> list:
@@ -81,57 +81,39 @@ class KomorebiClient:
                     if managed_window['hwnd'] == window_hwnd:
                         return add_index(workspace, i)
 
+    # Commands are run in the background by the process runner, which logs any command failing to start
     def activate_workspace(self, ws_idx: int) -> None:
-        subprocess.Popen([self._komorebic_path, "focus-workspace", str(ws_idx)], shell=True)
+        process_runner.run_in_background([self._komorebic_path, "focus-workspace", str(ws_idx)], shell=True)
 
     def next_workspace(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "cycle-workspace", "next"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to cycle komorebi workspace")
+        process_runner.run_in_background([self._komorebic_path, "cycle-workspace", "next"], shell=True)
 
     def prev_workspace(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "cycle-workspace", "prev"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to cycle komorebi workspace")
+        process_runner.run_in_background([self._komorebic_path, "cycle-workspace", "prev"], shell=True)
 
     def toggle_focus_mouse(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "toggle-focus-follows-mouse"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to toggle focus-follows-mouse")
+        process_runner.run_in_background([self._komorebic_path, "toggle-focus-follows-mouse"], shell=True)
 
     def change_layout(self, layout: str) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "change-layout", layout], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception(f"Failed to change layout of currently active workspace to {layout}")
+        process_runner.run_in_background([self._komorebic_path, "change-layout", layout], shell=True)
 
     def flip_layout(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "flip-layout"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True
-            )
-        except subprocess.SubprocessError:
-            pass
+        process_runner.run_in_background(
+            [self._komorebic_path, "flip-layout"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            shell=True
+        )
 
     def toggle(self, toggle_type: str):
-        try:
-            subprocess.Popen([self._komorebic_path, f"toggle-{toggle_type}"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception(f"Failed to toggle {toggle_type} for currently active workspace")
+        process_runner.run_in_background([self._komorebic_path, f"toggle-{toggle_type}"], shell=True)
 
     def wait_until_subscribed_to_pipe(self, pipe_name: str):
-        proc = subprocess.Popen(
+        proc = process_runner.run(
             [self._komorebic_path, "subscribe", pipe_name],
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
-        _stdout, stderr = proc.communicate()
 
-        return stderr, proc
+        return proc.stderr, proc
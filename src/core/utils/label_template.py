@@ -0,0 +1,158 @@
+import functools
+import re
+from string import Formatter
+from typing import Any, Callable, Optional
+
+FIELD_NAME_PATTERN = re.compile(r'[^.\[]*')
+FIELD_ACCESSOR_PATTERN = re.compile(r'\.(\w+)|\[([^\]]+)]')
+DATETIME_FORMAT_PATTERN = re.compile(r'\{(.*)}')
+CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_naturalsize() -> Callable[[int], str]:
+    # humanize is only imported once the first size is formatted, as it adds noticeably to startup time
+    from humanize import naturalsize
+    return naturalsize
+
+
+def format_size(num_bytes: int) -> str:
+    """
+    Formats the number of bytes as a human-readable size, e.g. '1.2 GB'. Sizes which change between ticks, such as
+    free memory or transfer speeds, rarely repeat, so formatted sizes are not cached.
+    """
+    return _get_naturalsize()(num_bytes)
+
+
+class _Field:
+    """
+    A replacement field parsed from a label, e.g. '{info[freq][current]:.2f}'. Accessors mirror str.format
+    field names, where '.name' is an attribute lookup and '[key]' an item lookup with numeric keys as indices.
+    """
+
+    def __init__(self, field_name: str, conversion: Optional[str], format_spec: str, field_text: str = None):
+        self.name = FIELD_NAME_PATTERN.match(field_name).group()
+        self.accessors = [
+            (True, attr_name) if attr_name else (False, int(key) if key.isdigit() else key)
+            for attr_name, key in FIELD_ACCESSOR_PATTERN.findall(field_name[len(self.name):])
+        ]
+        self.conversion = conversion
+        self.format_spec = format_spec or ""
+        self.text = field_text or "".join([
+            "{", field_name, f"!{conversion}" if conversion else "", f":{format_spec}" if format_spec else "", "}"
+        ])
+
+    def render(self, values: dict[str, Any]) -> str:
+        value = values[self.name]
+
+        for is_attr, accessor in self.accessors:
+            value = getattr(value, accessor) if is_attr else value[accessor]
+
+        if self.conversion:
+            value = CONVERSIONS[self.conversion](value)
+
+        return format(value, self.format_spec)
+
+
+def _compile_renderer(segments: list[tuple[str, Optional[_Field]]]) -> Callable[[dict[str, Any]], str]:
+    # Labels are compiled into a function formatting their literal text and fields in a single f-string, which
+    # builds the label without intermediate lists or calls to format(). All text taken from the label is bound to
+    # the function's default arguments and never becomes part of its source.
+    constants = {}
+    parts = []
+
+    for i, (literal_text, field) in enumerate(segments):
+        if literal_text:
+            constants[f'_literal_{i}'] = literal_text
+            parts.append(f'{{_literal_{i}}}')
+
+        if field is None:
+            continue
+
+        constants[f'_name_{i}'] = field.name
+        expression = f'values[_name_{i}]'
+
+        for j, (is_attr, accessor) in enumerate(field.accessors):
+            constants[f'_accessor_{i}_{j}'] = accessor
+            expression = f'getattr({expression}, _accessor_{i}_{j})' if is_attr else f'{expression}[_accessor_{i}_{j}]'
+
+        conversion = f'!{field.conversion}' if field.conversion else ''
+
+        if field.format_spec:
+            constants[f'_format_spec_{i}'] = field.format_spec
+            parts.append(f'{{{expression}{conversion}:{{_format_spec_{i}}}}}')
+        else:
+            parts.append(f'{{{expression}{conversion}}}')
+
+    arguments = "".join(f', {name}={name}' for name in constants)
+    namespace = dict(constants)
+    exec(f'def render(values{arguments}):\n    return f"{"".join(parts)}"', namespace)
+    return namespace['render']
+
+
+class LabelTemplate:
+    """
+    A label compiled once into a renderer of its literal text and replacement fields. Fields use str.format
+    syntax, including conversions and format specs (e.g. '{info[freq][current]:.2f}'). Fields whose name is not
+    provided when rendering are kept as written, so label text in curly brackets is left untouched.
+    """
+
+    def __init__(self, template: str, segments: list[tuple[str, Optional[_Field]]], datetime_format: str = None):
+        self.template = template
+        self.datetime_format = datetime_format
+        self.field_names = frozenset(field.name for _, field in segments if field)
+        self.field_paths = frozenset(
+            (field.name, *(accessor for _, accessor in field.accessors)) for _, field in segments if field
+        )
+        self._segments = segments
+        self._renderer = _compile_renderer(segments)
+
+    def render(self, **values: Any) -> str:
+        try:
+            return self._renderer(values)
+        except KeyError:
+            if self.field_names <= values.keys():
+                raise
+
+        # Fields which were not provided are rendered as written
+        return "".join(
+            literal_text + (field.render(values) if field.name in values else field.text) if field else literal_text
+            for literal_text, field in self._segments
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(template: str) -> LabelTemplate:
+    """
+    Compiles a label using str.format syntax. Labels which cannot be parsed, e.g. because of an unmatched curly
+    bracket, are rendered as written.
+    """
+    try:
+        segments = [
+            (literal_text, _Field(field_name, conversion, format_spec) if field_name is not None else None)
+            for literal_text, field_name, format_spec, conversion in Formatter().parse(template)
+        ]
+    except ValueError:
+        segments = [(template, None)]
+
+    return LabelTemplate(template, segments)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_datetime_template(template: str) -> LabelTemplate:
+    """
+    Compiles a clock label, which holds a datetime format between curly brackets, e.g. '{%H:%M:%S}'. The datetime
+    is rendered from the 'datetime' field, and the format is available as the template's datetime_format.
+    """
+    datetime_format_search = DATETIME_FORMAT_PATTERN.search(template)
+
+    if not datetime_format_search:
+        return LabelTemplate(template, [(template, None)])
+
+    datetime_format = datetime_format_search.group(1)
+    datetime_field = _Field('datetime', None, datetime_format, datetime_format_search.group())
+
+    return LabelTemplate(template, [
+        (template[:datetime_format_search.start()], datetime_field),
+        (template[datetime_format_search.end():], None)
+    ], datetime_format)
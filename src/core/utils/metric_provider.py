@@ -0,0 +1,242 @@
+import functools
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from core.utils.metric_samplers import METRIC_SAMPLERS, MetricSampler
+from core.utils.subscribers import SubscriberRegistry
+from core.utils.tick_scheduler import tick_scheduler
+from settings import SAMPLING_POOL_MAX_THREADS
+
+
+@functools.lru_cache(maxsize=None)
+def get_sampling_pool() -> QThreadPool:
+    # A dedicated pool, so slow samplers cannot starve other users of the global thread pool
+    sampling_pool = QThreadPool()
+    sampling_pool.setMaxThreadCount(SAMPLING_POOL_MAX_THREADS)
+    return sampling_pool
+
+
+class _SampleSignals(QObject):
+    sampled = pyqtSignal(object, float)
+    failed = pyqtSignal(float)
+
+
+class _SampleTask(QRunnable):
+
+    def __init__(self, source: str, sampler: MetricSampler, fields: Optional[frozenset[str]]):
+        super().__init__()
+        self.signals = _SampleSignals()
+        self._source = source
+        self._sampler = sampler
+        self._fields = fields
+
+    def run(self) -> None:
+        start = time.perf_counter()
+
+        try:
+            snapshot = self._sampler.sample(self._fields)
+        except Exception:
+            logging.exception(f"Failed to sample metric source '{self._source}'")
+            self.signals.failed.emit((time.perf_counter() - start) * 1000)
+        else:
+            self.signals.sampled.emit(snapshot, (time.perf_counter() - start) * 1000)
+
+
+class MetricProvider(QObject):
+    """
+    Samples a data source once per interval and pushes each snapshot to every subscribed widget, so the cost
+    of sampling a source stays constant regardless of how many bars and screens display it. Samples are taken
+    on a bounded worker pool and delivered back to the GUI thread through queued signals. A sample which takes
+    longer than the sampler's timeout marks the provider as stale until the next sample arrives. Only the fields
+    requested by at least one subscriber are sampled.
+    """
+
+    def __init__(self, source: str, interval: int, sampler: MetricSampler):
+        super().__init__()
+        self.source = source
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_fields: Optional[frozenset[str]] = frozenset()
+        self.is_stale = False
+        self.num_samples = 0
+        self.num_failed_samples = 0
+        self.num_skipped_samples = 0
+        self.num_timeouts = 0
+        self.last_sample_ms: Optional[float] = None
+        self.max_sample_ms = 0.0
+        self._sampler = sampler
+        self._sample_task: Optional[_SampleTask] = None
+        self._sample_task_fields: Optional[frozenset[str]] = frozenset()
+        self._is_resample_pending = False
+        self._subscribers: dict[int, Callable[[Any, bool], None]] = {}
+        self._subscriber_registry = SubscriberRegistry(self._remove_subscriber)
+        self._subscriber_fields: dict[int, Optional[frozenset[str]]] = {}
+        self.fields: Optional[frozenset[str]] = frozenset()
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.setInterval(sampler.timeout)
+        self._timeout_timer.timeout.connect(self._on_sample_timeout)
+
+    @property
+    def num_subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(
+            self,
+            subscriber: QObject,
+            callback: Callable[[Any, bool], None],
+            fields: Optional[frozenset[str]] = None
+    ) -> None:
+        """
+        Pushes every snapshot to the callback until the subscriber is unsubscribed or destroyed. Subscribers may
+        request a subset of the fields collected by the provider's sampler, or all fields if none are given.
+        """
+        subscriber_id = self._subscriber_registry.add(subscriber)
+        is_first_subscriber = not self._subscribers
+        prev_fields = self.fields
+        self._subscribers[subscriber_id] = callback
+        self._subscriber_fields[subscriber_id] = fields
+        self._update_fields()
+
+        if is_first_subscriber:
+            if self.interval > 0:
+                tick_scheduler.subscribe(self, self.interval, self._request_sample)
+            self._request_sample()
+        elif self.fields != prev_fields:
+            # The latest snapshot lacks some of the newly requested fields, so a new sample is taken right away
+            self._request_sample()
+        elif self.snapshot is not None and self._has_fields(fields):
+            # New subscribers immediately receive the latest snapshot instead of waiting for the next interval
+            callback(self.snapshot, self.is_stale)
+
+    def unsubscribe(self, subscriber: QObject) -> None:
+        self._remove_subscriber(id(subscriber))
+
+    def _has_fields(self, fields: Optional[frozenset[str]]) -> bool:
+        # Snapshots sampled before a subscriber requested additional fields lack those fields
+        if self.snapshot_fields is None:
+            return True
+
+        return fields is not None and fields <= self.snapshot_fields
+
+    def _update_fields(self) -> None:
+        subscriber_fields = list(self._subscriber_fields.values())
+        self.fields = None if None in subscriber_fields else frozenset().union(*subscriber_fields)
+
+    def _remove_subscriber(self, subscriber_id: int) -> None:
+        self._subscriber_registry.discard(subscriber_id)
+        self._subscriber_fields.pop(subscriber_id, None)
+        self._update_fields()
+
+        if self._subscribers.pop(subscriber_id, None) and not self._subscribers:
+            tick_scheduler.unsubscribe(self)
+            _metric_providers.pop((self.source, self.interval), None)
+
+            # Subscribers may outlive the provider's timer while the application shuts down
+            with suppress(RuntimeError):
+                self._timeout_timer.stop()
+
+    def _request_sample(self) -> None:
+        # A sample which is still running is never overlapped by another one of the same source. If fields were
+        # requested since it started, another sample is taken as soon as it finishes.
+        if self._sample_task:
+            if self.fields != self._sample_task_fields:
+                self._is_resample_pending = True
+            else:
+                self.num_skipped_samples += 1
+            return
+
+        self._sample_task = _SampleTask(self.source, self._sampler, self.fields)
+        self._sample_task_fields = self.fields
+        self._sample_task.signals.sampled.connect(self._on_sampled)
+        self._sample_task.signals.failed.connect(self._on_sample_failed)
+        self._timeout_timer.start()
+        get_sampling_pool().start(self._sample_task)
+
+    def _finish_sample(self, duration_ms: float) -> None:
+        self._sample_task = None
+        self._timeout_timer.stop()
+        self.last_sample_ms = duration_ms
+        self.max_sample_ms = max(self.max_sample_ms, duration_ms)
+
+    def _request_pending_sample(self) -> None:
+        if self._is_resample_pending:
+            self._is_resample_pending = False
+            self._request_sample()
+
+    @pyqtSlot(object, float)
+    def _on_sampled(self, snapshot: Any, duration_ms: float) -> None:
+        self._finish_sample(duration_ms)
+        self.num_samples += 1
+        self.snapshot = snapshot
+        self.snapshot_fields = self._sample_task_fields
+        self.is_stale = False
+        self._notify_subscribers()
+        self._request_pending_sample()
+
+    @pyqtSlot(float)
+    def _on_sample_failed(self, duration_ms: float) -> None:
+        self._finish_sample(duration_ms)
+        self.num_failed_samples += 1
+        self._request_pending_sample()
+
+    @pyqtSlot()
+    def _on_sample_timeout(self) -> None:
+        self.num_timeouts += 1
+
+        if not self.is_stale:
+            logging.warning(f"Sampling metric source '{self.source}' exceeded {self._sampler.timeout}ms timeout")
+            self.is_stale = True
+
+            if self.snapshot is not None:
+                self._notify_subscribers()
+
+    def _notify_subscribers(self) -> None:
+        self._subscriber_registry.notify(
+            [
+                (subscriber_id, callback) for subscriber_id, callback in self._subscribers.items()
+                if self._has_fields(self._subscriber_fields.get(subscriber_id))
+            ],
+            self.snapshot,
+            self.is_stale
+        )
+
+
+_metric_providers: dict[tuple[str, int], MetricProvider] = {}
+
+
+def get_metric_provider(source: str, interval: int) -> MetricProvider:
+    """
+    Returns the provider sampling the given source at the given interval, shared by all widgets which
+    display the source at that interval. Providers are discarded once their last subscriber is removed.
+    """
+    provider = _metric_providers.get((source, interval))
+
+    if provider is None:
+        provider = MetricProvider(source, interval, METRIC_SAMPLERS[source]())
+        _metric_providers[(source, interval)] = provider
+
+    return provider
+
+
+def get_metric_provider_stats() -> list[dict]:
+    return [
+        {
+            'source': provider.source,
+            'interval': provider.interval,
+            'subscribers': provider.num_subscribers,
+            'fields': sorted(provider.fields) if provider.fields is not None else 'all',
+            'samples': provider.num_samples,
+            'failed': provider.num_failed_samples,
+            'skipped': provider.num_skipped_samples,
+            'timeouts': provider.num_timeouts,
+            'stale': provider.is_stale,
+            'max_sample_ms': round(provider.max_sample_ms, 2)
+        } for provider in _metric_providers.values()
+    ]
+
+
+def log_metric_provider_stats() -> None:
+    logging.info(f"Metric providers: {get_metric_provider_stats()}")
@@ -0,0 +1,139 @@
+import functools
+import subprocess
+import time
+import psutil
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+from core.utils.process_runner import process_runner
+
+
+class MetricSampler(ABC):
+    """
+    Samples a single data source. A sampler instance is owned by exactly one metric provider, so samplers
+    may keep state between samples, e.g. to compute the difference to the previous sample. Samples are taken
+    on a worker thread and are considered stale once they take longer than the sampler's timeout in milliseconds.
+    """
+    timeout: int = 1000
+
+    @abstractmethod
+    def sample(self, fields: Optional[frozenset[str]] = None):
+        ...
+
+
+class FieldSampler(MetricSampler):
+    """
+    Samples dict snapshots by mapping each field to the function collecting it, so only the fields requested by
+    subscribers are collected, or all fields if any subscriber requests all of them.
+    """
+
+    def __init__(self, field_collectors: dict[str, Callable[[], Any]]):
+        self.field_collectors = field_collectors
+
+    def sample(self, fields: Optional[frozenset[str]] = None) -> dict:
+        return {
+            field: collect() for field, collect in self.field_collectors.items()
+            if fields is None or field in fields
+        }
+
+
+class CpuSampler(FieldSampler):
+
+    def __init__(self):
+        super().__init__({
+            'freq': psutil.cpu_freq,
+            'stats': psutil.cpu_stats,
+            'percent': psutil.cpu_percent,
+            'percent_per_core': functools.partial(psutil.cpu_percent, percpu=True),
+            'cores_physical': functools.partial(psutil.cpu_count, logical=False),
+            'cores_total': functools.partial(psutil.cpu_count, logical=True)
+        })
+
+
+class MemorySampler(FieldSampler):
+
+    def __init__(self):
+        super().__init__({
+            'virtual_memory': psutil.virtual_memory,
+            'swap_memory': psutil.swap_memory
+        })
+
+
+class NetIoSampler(MetricSampler):
+
+    def __init__(self):
+        io = psutil.net_io_counters()
+        self._bytes_sent = io.bytes_sent
+        self._bytes_recv = io.bytes_recv
+        self._sampled_at = time.monotonic()
+
+    def sample(self, fields: Optional[frozenset[str]] = None) -> dict:
+        io = psutil.net_io_counters()
+        sampled_at = time.monotonic()
+        # The elapsed time varies with the sampling interval, e.g. in low power mode
+        snapshot = {
+            'bytes_sent': io.bytes_sent,
+            'bytes_recv': io.bytes_recv,
+            'bytes_sent_diff': io.bytes_sent - self._bytes_sent,
+            'bytes_recv_diff': io.bytes_recv - self._bytes_recv,
+            'elapsed': max(sampled_at - self._sampled_at, 0.001)
+        }
+        self._bytes_sent = io.bytes_sent
+        self._bytes_recv = io.bytes_recv
+        self._sampled_at = sampled_at
+        return snapshot
+
+
+class BatterySampler(MetricSampler):
+    timeout = 2000
+
+    def sample(self, fields: Optional[frozenset[str]] = None):
+        return psutil.sensors_battery()
+
+
+class WifiSampler(MetricSampler):
+    timeout = 5000
+
+    def sample(self, fields: Optional[frozenset[str]] = None) -> dict:
+        # A single netsh query provides both the signal strength and the name of the connected network
+        result = process_runner.run(
+            "netsh wlan show interfaces",
+            timeout=self.timeout / 1000,
+            stdout=subprocess.PIPE,
+            text=True,
+            shell=True
+        ).stdout
+        return {
+            'strength': self._parse_strength(result),
+            'name': self._parse_name(result)
+        }
+
+    @staticmethod
+    def _parse_strength(result: str) -> int:
+        # Return 0 if no wifi interface is found
+        if "There is no wireless interface on the system." in result:
+            return 0
+
+        # Extract signal strength from the result
+        for line in result.split("\n"):
+            if "Signal" in line:  # FIXME: This will break if the system language is not English
+                strength = line.split(":")[1].strip().split(" ")[0].replace("%", "")
+                return int(strength)
+
+        return 0
+
+    @staticmethod
+    def _parse_name(result: str) -> str:
+        for line in result.split("\n"):
+            if "SSID" in line:
+                return line.split(":")[1].strip()
+
+        return "No WiFi"
+
+
+METRIC_SAMPLERS: dict[str, type[MetricSampler]] = {
+    'cpu': CpuSampler,
+    'memory': MemorySampler,
+    'net_io': NetIoSampler,
+    'battery': BatterySampler,
+    'wifi': WifiSampler
+}
@@ -0,0 +1,67 @@
+import logging
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.utils.metric_provider import MetricProvider, get_metric_provider
+from core.utils.tick_scheduler import tick_scheduler
+from core.validation.widgets.yasb.battery import DEFAULTS as BATTERY_DEFAULTS
+
+
+class PowerMonitor(QObject):
+    """
+    Switches low power mode on and off as the battery state changes. While in low power mode, the interval of
+    every scheduled widget update and metric sample is multiplied by the configured interval multiplier, and clocks
+    are updated at correspondingly coarser boundaries. The battery is polled at the default update interval of the
+    battery widget, so the monitor shares the provider of battery widgets which keep that interval.
+    """
+    changed = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.is_low_power = False
+        self._options = None
+        self._battery_provider: MetricProvider = None
+
+    def configure(self, low_power_options: dict) -> None:
+        self._options = low_power_options
+
+        if low_power_options['enabled'] and not self._battery_provider:
+            self._battery_provider = get_metric_provider("battery", BATTERY_DEFAULTS['update_interval'])
+            self._battery_provider.subscribe(self, self._on_battery_state)
+        elif not low_power_options['enabled'] and self._battery_provider:
+            self._stop_monitoring()
+            self._set_low_power(False)
+        elif self._battery_provider and self._battery_provider.snapshot is not None:
+            # Re-evaluate the latest battery state against the updated options
+            self._on_battery_state(self._battery_provider.snapshot, False)
+
+    def _stop_monitoring(self) -> None:
+        self._battery_provider.unsubscribe(self)
+        self._battery_provider = None
+
+    def _on_battery_state(self, battery_state, _is_stale: bool) -> None:
+        if battery_state is None:
+            logging.info("No battery detected. Low power mode will not be activated.")
+            self._stop_monitoring()
+            return
+
+        is_low_power = (
+            (self._options['on_battery'] and not battery_state.power_plugged) or
+            battery_state.percent <= self._options['battery_threshold']
+        )
+        self._set_low_power(is_low_power)
+
+    def _set_low_power(self, is_low_power: bool) -> None:
+        interval_multiplier = self._options['interval_multiplier'] if is_low_power else 1.0
+        tick_scheduler.set_interval_multiplier(interval_multiplier)
+
+        if is_low_power == self.is_low_power:
+            return
+
+        self.is_low_power = is_low_power
+        logging.info(
+            f"Low power mode {'activated' if is_low_power else 'deactivated'}. "
+            f"Widget update intervals are multiplied by {interval_multiplier}"
+        )
+        self.changed.emit(is_low_power)
+
+
+power_monitor = PowerMonitor()
@@ -0,0 +1,281 @@
+import functools
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, suppress
+from typing import Iterator, Optional, Union
+import psutil
+from PyQt6.QtCore import QRunnable, QThreadPool
+from core.utils.reports import format_ms
+from settings import (
+    BACKGROUND_POOL_MAX_THREADS,
+    COMMAND_POOL_MAX_THREADS,
+    DEFAULT_MAX_CONCURRENT_PROCESSES,
+    PROCESS_LATENCY_SAMPLES
+)
+
+Command = Union[str, list[str]]
+LATENCY_PERCENTILES = [50, 90, 99]
+
+
+@functools.lru_cache(maxsize=None)
+def get_command_pool() -> QThreadPool:
+    # A dedicated pool, so slow commands cannot starve metric sampling or other users of the global thread pool
+    command_pool = QThreadPool()
+    command_pool.setMaxThreadCount(COMMAND_POOL_MAX_THREADS)
+    return command_pool
+
+
+@functools.lru_cache(maxsize=None)
+def get_background_pool() -> QThreadPool:
+    # Commands triggered by user input are queued separately, so they never wait behind widget commands for a thread
+    background_pool = QThreadPool()
+    background_pool.setMaxThreadCount(BACKGROUND_POOL_MAX_THREADS)
+    return background_pool
+
+
+def kill_process_tree(process: subprocess.Popen) -> None:
+    """
+    Kills a process along with all of its descendants. Killing only a shell such as cmd.exe leaves the commands it
+    started running, and those keep the shell's output pipe open.
+    """
+    if process.poll() is not None:
+        return
+
+    try:
+        descendants = psutil.Process(process.pid).children(recursive=True)
+    except psutil.Error:
+        descendants = []
+
+    # The process is killed first, so it cannot start further descendants while they are killed
+    with suppress(OSError):
+        process.kill()
+
+    for descendant in descendants:
+        with suppress(psutil.Error):
+            descendant.kill()
+
+
+def _get_command_line(cmd: Command) -> str:
+    return cmd if isinstance(cmd, str) else " ".join(cmd)
+
+
+def _percentile(sorted_values: list[float], percentile: int) -> Optional[float]:
+    if not sorted_values:
+        return None
+
+    return sorted_values[round(percentile / 100 * (len(sorted_values) - 1))]
+
+
+class _CommandStats:
+
+    def __init__(self):
+        self.num_spawns = 0
+        self.num_failures = 0
+        self.num_timeouts = 0
+        self.total_queued_ms = 0.0
+        self.latencies_ms: deque[float] = deque(maxlen=PROCESS_LATENCY_SAMPLES)
+
+    def report(self) -> dict:
+        latencies_ms = sorted(self.latencies_ms)
+        return {
+            'spawns': self.num_spawns,
+            'failures': self.num_failures,
+            'timeouts': self.num_timeouts,
+            **{f'p{percentile}_ms': _percentile(latencies_ms, percentile) for percentile in LATENCY_PERCENTILES},
+            'max_ms': latencies_ms[-1] if latencies_ms else None,
+            'mean_queued_ms': self.total_queued_ms / self.num_spawns if self.num_spawns else None
+        }
+
+
+class _BackgroundTask(QRunnable):
+
+    def __init__(self, cmd: Command, popen_kwargs: dict):
+        super().__init__()
+        self._cmd = cmd
+        self._popen_kwargs = popen_kwargs
+
+    def run(self) -> None:
+        try:
+            process_runner.run(self._cmd, **self._popen_kwargs)
+        except Exception:
+            logging.exception(f"Failed to run command {self._cmd}")
+
+
+class ProcessRunner:
+    """
+    Spawns every process started by yasb, so the number of processes running at once is bounded and the cost of
+    each command is accounted for. Processes which are waited for hold one of the concurrency slots until they
+    exit, and further processes are queued until a slot is free. Spawn counts, failures, timeouts and latency
+    percentiles are recorded per command line.
+    """
+
+    def __init__(self):
+        self.max_concurrency = DEFAULT_MAX_CONCURRENT_PROCESSES
+        self.max_queued = 0
+        self._num_running = 0
+        self._num_queued = 0
+        self._condition = threading.Condition()
+        self._stats: dict[str, _CommandStats] = {}
+
+    def configure(self, max_concurrency: int) -> None:
+        with self._condition:
+            self.max_concurrency = max_concurrency
+            self._condition.notify_all()
+
+    @contextmanager
+    def spawn(self, cmd: Command, queue_timeout: Optional[float] = None, **popen_kwargs) -> Iterator[subprocess.Popen]:
+        """
+        Spawns a process once a concurrency slot is free and holds the slot until the process has exited. The
+        process is waited for when leaving the context, or killed along with its descendants if the context is
+        left with an exception.
+        Raises subprocess.TimeoutExpired if no slot becomes free within the queue timeout (in seconds).
+        """
+        queued_at = time.perf_counter()
+
+        if not self._acquire(queue_timeout):
+            self._record(cmd, None, queue_timeout * 1000, is_failure=True, is_timeout=True)
+            raise subprocess.TimeoutExpired(cmd, queue_timeout)
+
+        started_at = time.perf_counter()
+        return_code = None
+        is_timeout = False
+
+        try:
+            process = subprocess.Popen(cmd, **popen_kwargs)
+
+            try:
+                yield process
+            except BaseException as e:
+                is_timeout = isinstance(e, subprocess.TimeoutExpired)
+                kill_process_tree(process)
+                raise
+            finally:
+                return_code = process.wait()
+        finally:
+            self._release()
+            self._record(
+                cmd,
+                (time.perf_counter() - started_at) * 1000,
+                (started_at - queued_at) * 1000,
+                is_failure=return_code != 0,
+                is_timeout=is_timeout
+            )
+
+    def run(self, cmd: Command, timeout: Optional[float] = None, **popen_kwargs) -> subprocess.CompletedProcess:
+        """
+        Runs a process to completion like subprocess.run. The timeout (in seconds) includes the time spent
+        waiting for a free concurrency slot.
+        """
+        queued_at = time.perf_counter()
+
+        with self.spawn(cmd, timeout, **popen_kwargs) as process:
+            remaining_timeout = None if timeout is None else max(timeout - (time.perf_counter() - queued_at), 0)
+            stdout, stderr = process.communicate(timeout=remaining_timeout)
+
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    def check_output(self, cmd: Command, timeout: Optional[float] = None, **popen_kwargs) -> Union[bytes, str]:
+        result = self.run(cmd, timeout, stdout=subprocess.PIPE, **popen_kwargs)
+
+        if result.returncode:
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+        return result.stdout
+
+    def run_in_background(self, cmd: Command, **popen_kwargs) -> None:
+        """
+        Queues a process to be run to completion on the background pool, e.g. commands triggered by user input
+        which must not block the GUI thread while waiting for a free concurrency slot.
+        """
+        get_background_pool().start(_BackgroundTask(cmd, popen_kwargs))
+
+    def start(self, cmd: Command, **popen_kwargs) -> subprocess.Popen:
+        """
+        Starts a process without waiting for it, e.g. applications launched by callbacks or long-lived streaming
+        commands. Such processes may outlive yasb, so they never hold a concurrency slot and only their spawn
+        latency is recorded.
+        """
+        started_at = time.perf_counter()
+        is_failure = True
+
+        try:
+            process = subprocess.Popen(cmd, **popen_kwargs)
+            is_failure = False
+            return process
+        finally:
+            self._record(cmd, (time.perf_counter() - started_at) * 1000, 0, is_failure=is_failure)
+
+    def _acquire(self, timeout: Optional[float]) -> bool:
+        with self._condition:
+            self._num_queued += 1
+            self.max_queued = max(self.max_queued, self._num_queued)
+
+            try:
+                is_acquired = self._condition.wait_for(lambda: self._num_running < self.max_concurrency, timeout)
+            finally:
+                self._num_queued -= 1
+
+            if is_acquired:
+                self._num_running += 1
+
+            return is_acquired
+
+    def _release(self) -> None:
+        with self._condition:
+            self._num_running -= 1
+            self._condition.notify()
+
+    def _record(
+            self,
+            cmd: Command,
+            latency_ms: Optional[float],
+            queued_ms: float,
+            is_failure: bool,
+            is_timeout: bool = False
+    ) -> None:
+        with self._condition:
+            stats = self._stats.setdefault(_get_command_line(cmd), _CommandStats())
+            stats.num_spawns += latency_ms is not None
+            stats.num_failures += is_failure
+            stats.num_timeouts += is_timeout
+            stats.total_queued_ms += queued_ms
+
+            if latency_ms is not None:
+                stats.latencies_ms.append(latency_ms)
+
+    def report(self) -> dict:
+        with self._condition:
+            command_reports = {command_line: stats.report() for command_line, stats in self._stats.items()}
+
+            return {
+                'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'max_concurrency': self.max_concurrency,
+                'running': self._num_running,
+                'queued': self._num_queued,
+                'max_queued': self.max_queued,
+                'commands': dict(sorted(command_reports.items(), key=lambda item: item[1]['spawns'], reverse=True))
+            }
+
+    def log_report(self) -> None:
+        report = self.report()
+        lines = [
+            f"Process report: at most {report['max_concurrency']} concurrent process(es), "
+            f"at most {report['max_queued']} queued"
+        ]
+
+        for command_line, command_report in report['commands'].items():
+            percentiles = ", ".join(
+                f"p{percentile} {format_ms(command_report[f'p{percentile}_ms'])}" for percentile in LATENCY_PERCENTILES
+            )
+            lines.append(
+                f"  {command_line}: {command_report['spawns']} spawn(s), {command_report['failures']} failure(s), "
+                f"{command_report['timeouts']} timeout(s), {percentiles}, max {format_ms(command_report['max_ms'])}"
+            )
+
+        logging.info("\n".join(lines))
+
+
+process_runner = ProcessRunner()
@@ -0,0 +1,98 @@
+import logging
+import time
+import psutil
+from contextlib import contextmanager
+from typing import Optional
+from core.utils.reports import format_ms
+
+PROFILE_CATEGORIES = ['phases', 'bars', 'widgets', 'listeners']
+
+
+class StartupProfiler:
+    """
+    Records the wall-clock and CPU time spent in each startup phase, bar and widget type.
+    All measurements are no-ops unless the profiler has been enabled, e.g. via --profile-startup.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._start_wall = None
+        self._launch_offset_ms = None
+        self._first_bar_visible_ms = None
+        self._startup_complete_ms = None
+        self._startup_complete_cpu_ms = None
+        self._timings: dict[str, dict[str, dict]] = {category: {} for category in PROFILE_CATEGORIES}
+
+    def enable(self) -> None:
+        # Timings are relative to process creation, so they include interpreter startup and module imports
+        self.enabled = True
+        self._launch_offset_ms = (time.time() - psutil.Process().create_time()) * 1000
+        self._start_wall = time.perf_counter() - self._launch_offset_ms / 1000
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start_wall) * 1000
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            timing = self._timings[category].setdefault(name, {'count': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0})
+            timing['count'] += 1
+            timing['wall_ms'] += (time.perf_counter() - start_wall) * 1000
+            timing['cpu_ms'] += (time.process_time() - start_cpu) * 1000
+
+            if category == 'bars' and self._first_bar_visible_ms is None:
+                self._first_bar_visible_ms = self._elapsed_ms()
+
+    def phase(self, name: str):
+        return self.measure('phases', name)
+
+    def mark_startup_complete(self) -> None:
+        if self.enabled and self._startup_complete_ms is None:
+            self._startup_complete_ms = self._elapsed_ms()
+            self._startup_complete_cpu_ms = time.process_time() * 1000
+
+    def report(self) -> dict:
+        return {
+            'created_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'profiler_enabled_ms': self._launch_offset_ms,
+            'first_bar_visible_ms': self._first_bar_visible_ms,
+            'startup_complete_ms': self._startup_complete_ms,
+            'startup_complete_cpu_ms': self._startup_complete_cpu_ms,
+            **self._timings
+        }
+
+    def log_report(self) -> None:
+        report = self.report()
+        lines = [
+            "Startup profile:",
+            f"  profiler enabled after {format_ms(report['profiler_enabled_ms'])}",
+            f"  first bar visible after {format_ms(report['first_bar_visible_ms'])}",
+            f"  startup complete after {format_ms(report['startup_complete_ms'])} "
+            f"({format_ms(report['startup_complete_cpu_ms'])} CPU)"
+        ]
+
+        for category in PROFILE_CATEGORIES:
+            timings = sorted(report[category].items(), key=lambda item: item[1]['wall_ms'], reverse=True)
+
+            if timings:
+                lines.append(f"  {category}:")
+
+            for name, timing in timings:
+                lines.append(
+                    f"    {name}: {format_ms(timing['wall_ms'])} wall, {format_ms(timing['cpu_ms'])} CPU "
+                    f"({timing['count']} call(s))"
+                )
+
+        logging.info("\n".join(lines))
+
+
+startup_profiler = StartupProfiler()
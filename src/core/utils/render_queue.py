@@ -0,0 +1,66 @@
+import logging
+from PyQt6.QtCore import QObject, QTimer
+
+
+class RenderQueue(QObject):
+    """
+    Collects widgets with pending label updates and applies all of them in a single pass once control returns
+    to the event loop, so bursts of events within the same frame cause one layout and repaint per label.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._dirty_widgets: dict[int, QObject] = {}
+        self._is_flush_scheduled = False
+        self.num_flushes = 0
+        self.num_applied = 0
+        self.num_skipped = 0
+        self.num_coalesced = 0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'flushes': self.num_flushes,
+            'applied': self.num_applied,
+            'skipped': self.num_skipped,
+            'coalesced': self.num_coalesced
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        logging.info(
+            f"Render queue: {stats['applied']} label update(s) applied in {stats['flushes']} flush(es), "
+            f"{stats['skipped']} unchanged update(s) skipped, {stats['coalesced']} update(s) coalesced"
+        )
+
+    def schedule(self, widget: QObject) -> None:
+        self._dirty_widgets[id(widget)] = widget
+
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self) -> None:
+        """
+        Immediately applies the pending label updates of all dirty widgets
+        """
+        dirty_widgets = list(self._dirty_widgets.values())
+        self._dirty_widgets.clear()
+        self._is_flush_scheduled = False
+
+        if not dirty_widgets:
+            return
+
+        for widget in dirty_widgets:
+            try:
+                widget.apply_renders()
+            except RuntimeError:
+                # The widget's underlying C++ object was deleted before its pending updates were applied
+                pass
+            except Exception:
+                logging.exception(f"Failed to apply pending label updates of {widget}")
+
+        self.num_flushes += 1
+
+
+render_queue = RenderQueue()
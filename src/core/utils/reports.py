@@ -0,0 +1,20 @@
+import json
+import logging
+from typing import Any, Optional
+
+
+def format_ms(duration_ms: Optional[float]) -> str:
+    return "n/a" if duration_ms is None else f"{duration_ms:.1f}ms"
+
+
+def write_report(report: dict[str, Any], report_path: str, report_name: str) -> None:
+    """
+    Writes a profiling report as JSON, e.g. the startup profile written with --profile-startup. Failing to write a
+    report is logged rather than raised, as reports are written while the application exits.
+    """
+    try:
+        with open(report_path, 'w') as report_stream:
+            json.dump(report, report_stream, indent=2)
+        logging.info(f"Wrote {report_name} to {report_path}")
+    except OSError:
+        logging.exception(f"Failed to write {report_name} to {report_path}")
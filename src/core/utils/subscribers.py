@@ -0,0 +1,65 @@
+import logging
+from typing import Any, Callable, Iterable
+from PyQt6.QtCore import QObject
+
+# Removal callbacks of the registries each subscriber was added to, keyed by subscriber and registry. The destroyed
+# signal of a subscriber is connected once for its whole lifetime, as PyQt keeps the proxy of a disconnected slot
+# alive until the signal's sender is destroyed, so the signal is never reconnected when a subscriber comes and goes.
+_destroyed_callbacks: dict[int, dict[int, Callable[[int], None]]] = {}
+
+
+def _on_subscriber_destroyed(subscriber_id: int) -> None:
+    for on_destroyed in list(_destroyed_callbacks.pop(subscriber_id, {}).values()):
+        on_destroyed(subscriber_id)
+
+
+class SubscriberRegistry:
+    """
+    Tracks the subscribers of a shared source and calls back once a subscriber is destroyed. Subscribers hold no
+    reference to the source after being discarded, so subscribers which come and go (e.g. widgets suspended while
+    hidden) never keep discarded sources alive.
+    """
+
+    def __init__(self, on_destroyed: Callable[[int], None]):
+        self._on_destroyed = on_destroyed
+        self._subscriber_ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriber_ids)
+
+    def add(self, subscriber: QObject) -> int:
+        subscriber_id = id(subscriber)
+
+        if subscriber_id not in _destroyed_callbacks:
+            _destroyed_callbacks[subscriber_id] = {}
+            subscriber.destroyed.connect(lambda: _on_subscriber_destroyed(subscriber_id))
+
+        _destroyed_callbacks[subscriber_id][id(self)] = self._on_destroyed
+        self._subscriber_ids.add(subscriber_id)
+        return subscriber_id
+
+    def discard(self, subscriber_id: int) -> None:
+        self._subscriber_ids.discard(subscriber_id)
+
+        # The subscriber's callbacks are already gone if it is removed by its destroyed signal
+        if subscriber_id in _destroyed_callbacks:
+            _destroyed_callbacks[subscriber_id].pop(id(self), None)
+
+    def notify(self, callbacks: Iterable[tuple[int, Callable[..., None]]], *args: Any) -> int:
+        """
+        Calls each subscriber's callback with the given arguments and returns the number of callbacks which ran.
+        Callbacks may add or remove subscribers, so the callbacks are copied before any of them is called.
+        """
+        num_notified = 0
+
+        for subscriber_id, callback in list(callbacks):
+            try:
+                callback(*args)
+                num_notified += 1
+            except RuntimeError:
+                # The subscriber's underlying C++ object was deleted before its destroyed signal was handled
+                self._on_destroyed(subscriber_id)
+            except Exception:
+                logging.exception(f"Failed to notify subscriber {callback}")
+
+        return num_notified
@@ -0,0 +1,157 @@
+import logging
+import math
+import statistics
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+from PyQt6.QtCore import QObject, QTimer, Qt
+from core.utils.subscribers import SubscriberRegistry
+
+# Number of most recent ticks used to compute tick duration statistics
+TICK_STATS_WINDOW = 256
+
+# Groups which become due within this many milliseconds of each other are run in the same tick
+TICK_TOLERANCE_MS = 2
+
+
+class TickScheduler(QObject):
+    """
+    Drives the timer callbacks of all widgets from a single timer. Widgets are grouped by their timer interval
+    and every group is aligned to multiples of its interval from a common epoch, so groups with related
+    intervals (e.g. 1s and 5s) fire in the same tick and all due callbacks run in one event loop pass.
+    All intervals are scaled by the interval multiplier, which is raised while in low power mode.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._epoch_ms = time.monotonic() * 1000
+        self._timer: Optional[QTimer] = None
+        self._groups: dict[int, dict[int, Callable]] = {}
+        self._subscriber_registry = SubscriberRegistry(self._remove_subscriber)
+        self._next_due_ms: dict[int, float] = {}
+        self._tick_durations_ms = deque(maxlen=TICK_STATS_WINDOW)
+        self.interval_multiplier = 1.0
+        self.num_ticks = 0
+        self.num_callbacks = 0
+        self.num_late_ticks = 0
+
+    @property
+    def stats(self) -> dict:
+        tick_durations_ms = sorted(self._tick_durations_ms)
+        return {
+            'subscribers': sum(len(group) for group in self._groups.values()),
+            'intervals': sorted(self._groups.keys()),
+            'interval_multiplier': self.interval_multiplier,
+            'ticks': self.num_ticks,
+            'callbacks': self.num_callbacks,
+            'late_ticks': self.num_late_ticks,
+            'tick_ms_mean': statistics.fmean(tick_durations_ms) if tick_durations_ms else 0.0,
+            'tick_ms_p95': tick_durations_ms[int(0.95 * (len(tick_durations_ms) - 1))] if tick_durations_ms else 0.0,
+            'tick_ms_max': tick_durations_ms[-1] if tick_durations_ms else 0.0
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        logging.info(
+            f"Tick scheduler: {stats['subscribers']} subscriber(s) in interval group(s) {stats['intervals']}, "
+            f"{stats['ticks']} tick(s) running {stats['callbacks']} callback(s), {stats['late_ticks']} late tick(s). "
+            f"Tick duration mean {stats['tick_ms_mean']:.2f}ms, p95 {stats['tick_ms_p95']:.2f}ms, "
+            f"max {stats['tick_ms_max']:.2f}ms"
+        )
+
+    def subscribe(self, subscriber: QObject, interval: int, callback: Callable) -> None:
+        """
+        Runs the callback every interval milliseconds until the subscriber is unsubscribed or destroyed.
+        """
+        subscriber_id = self._subscriber_registry.add(subscriber)
+        self._remove_from_groups(subscriber_id)
+
+        if interval not in self._groups:
+            self._groups[interval] = {}
+            self._next_due_ms[interval] = self._next_boundary_ms(interval, self._now_ms())
+
+        self._groups[interval][subscriber_id] = callback
+        self._schedule_next_tick()
+
+    def unsubscribe(self, subscriber: QObject) -> None:
+        self._remove_subscriber(id(subscriber))
+
+    def set_interval_multiplier(self, interval_multiplier: float) -> None:
+        if interval_multiplier == self.interval_multiplier:
+            return
+
+        # Groups are re-aligned to the boundaries of their scaled intervals
+        self.interval_multiplier = interval_multiplier
+        now_ms = self._now_ms()
+
+        for interval in self._next_due_ms.keys():
+            self._next_due_ms[interval] = self._next_boundary_ms(interval, now_ms)
+
+        if self._timer is not None:
+            self._schedule_next_tick()
+
+    def tick(self, intervals: Iterable[int] = None) -> None:
+        """
+        Immediately runs the callbacks of the given interval groups, or of all groups if none are given.
+        """
+        self._run_groups(list(self._groups.keys()) if intervals is None else list(intervals))
+
+    def _remove_subscriber(self, subscriber_id: int) -> None:
+        self._subscriber_registry.discard(subscriber_id)
+        self._remove_from_groups(subscriber_id)
+
+    def _remove_from_groups(self, subscriber_id: int) -> None:
+        for interval, group in list(self._groups.items()):
+            if group.pop(subscriber_id, None) and not group:
+                del self._groups[interval]
+                del self._next_due_ms[interval]
+
+    def _now_ms(self) -> float:
+        return time.monotonic() * 1000
+
+    def _next_boundary_ms(self, interval: int, now_ms: float) -> float:
+        scaled_interval = interval * self.interval_multiplier
+        num_intervals = math.floor((now_ms - self._epoch_ms) / scaled_interval) + 1
+        return self._epoch_ms + num_intervals * scaled_interval
+
+    def _schedule_next_tick(self) -> None:
+        if self._timer is None:
+            # The timer is created on first use, as timers require a running application
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._timer.timeout.connect(self._on_tick)
+
+        if not self._next_due_ms:
+            self._timer.stop()
+            return
+
+        delay_ms = min(self._next_due_ms.values()) - self._now_ms()
+        self._timer.start(max(0, math.ceil(delay_ms)))
+
+    def _on_tick(self) -> None:
+        now_ms = self._now_ms()
+        due_intervals = [
+            interval for interval, due_ms in self._next_due_ms.items()
+            if due_ms <= now_ms + TICK_TOLERANCE_MS
+        ]
+
+        for interval in due_intervals:
+            if now_ms - self._next_due_ms[interval] >= interval * self.interval_multiplier:
+                self.num_late_ticks += 1
+            self._next_due_ms[interval] = self._next_boundary_ms(interval, now_ms + TICK_TOLERANCE_MS)
+
+        self._run_groups(due_intervals)
+        self._schedule_next_tick()
+
+    def _run_groups(self, intervals: list[int]) -> None:
+        start = time.perf_counter()
+
+        for interval in intervals:
+            self.num_callbacks += self._subscriber_registry.notify(self._groups.get(interval, {}).items())
+
+        self.num_ticks += 1
+        self._tick_durations_ms.append((time.perf_counter() - start) * 1000)
+
+
+tick_scheduler = TickScheduler()
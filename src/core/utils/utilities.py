@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QWidget
 from PyQt6.QtGui import QScreen
 
 
@@ -15,3 +15,22 @@ def is_valid_percentage_str(s: str) -> bool:
 
 def get_screen_by_name(screen_name: str) -> QScreen:
     return next(filter(lambda scr: screen_name in scr.name(), QApplication.screens()), None)
+
+
+def build_class_name(*class_names: str) -> str:
+    return " ".join(class_name for class_name in class_names if class_name)
+
+
+def set_class_property(widget: QWidget, class_name: str) -> bool:
+    """
+    Sets the 'class' property of the widget and re-polishes it only if the class actually changed. Unlike
+    setStyleSheet(''), this keeps the widget's style and does not re-polish all of the widget's children.
+    """
+    if widget.property("class") == class_name:
+        return False
+
+    widget.setProperty("class", class_name)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    widget.update()
+    return True
@@ -0,0 +1,74 @@
+import logging
+from typing import Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.utils.tick_scheduler import tick_scheduler
+from settings import VISIBILITY_POLL_INTERVAL
+
+try:
+    from core.utils.win32.visibility import get_fullscreen_monitor_hwnd, is_session_locked
+    from core.utils.win32.utilities import get_monitor_hwnd
+    IMPORT_WIN32_VISIBILITY_SUCCESSFUL = True
+except ImportError:
+    IMPORT_WIN32_VISIBILITY_SUCCESSFUL = False
+
+
+class VisibilityMonitor(QObject):
+    """
+    Tracks whether the session is locked and which monitor, if any, is covered by a fullscreen window.
+    Bars use it to suspend the timers of their widgets while they cannot be seen, which replaces the
+    wakeups of every widget on every bar with a single cheap poll.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.is_session_locked = False
+        self.fullscreen_monitor_hwnd: Optional[int] = None
+        self.num_suspensions = 0
+        self.num_saved_wakeups = 0
+        self._is_started = False
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'suspensions': self.num_suspensions,
+            'saved_wakeups': self.num_saved_wakeups
+        }
+
+    def start(self) -> None:
+        if IMPORT_WIN32_VISIBILITY_SUCCESSFUL and not self._is_started:
+            self._is_started = True
+            tick_scheduler.subscribe(self, VISIBILITY_POLL_INTERVAL, self._poll)
+
+    def is_window_occluded(self, hwnd: int, is_always_on_top: bool = False) -> bool:
+        """
+        Windows are occluded while the session is locked, or while a fullscreen window covers their monitor.
+        Windows which stay on top remain visible above fullscreen windows, so only a locked session occludes them.
+        """
+        if not IMPORT_WIN32_VISIBILITY_SUCCESSFUL:
+            return False
+
+        if self.is_session_locked:
+            return True
+
+        return not is_always_on_top and self.fullscreen_monitor_hwnd == get_monitor_hwnd(hwnd)
+
+    def record_suspension(self, num_saved_wakeups: int) -> None:
+        self.num_suspensions += 1
+        self.num_saved_wakeups += num_saved_wakeups
+
+    def _poll(self) -> None:
+        session_locked = is_session_locked()
+        fullscreen_monitor_hwnd = get_fullscreen_monitor_hwnd()
+
+        if session_locked != self.is_session_locked or fullscreen_monitor_hwnd != self.fullscreen_monitor_hwnd:
+            self.is_session_locked = session_locked
+            self.fullscreen_monitor_hwnd = fullscreen_monitor_hwnd
+            logging.info(
+                f"Visibility changed (session locked: {session_locked}, fullscreen monitor: {fullscreen_monitor_hwnd}). "
+                f"Saved {self.num_saved_wakeups} widget wakeup(s) over {self.num_suspensions} suspension(s) so far"
+            )
+            self.changed.emit()
+
+
+visibility_monitor = VisibilityMonitor()
@@ -1,14 +1,37 @@
-import yaml
 import logging
+from dataclasses import dataclass
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QThread
 from typing import Optional
-from cerberus import Validator
-from importlib import import_module
 from core.utils.alert_dialog import raise_info_alert
+from core.utils.widget_registry import WidgetType, get_widget_type, widget_options_cache
+from core.utils.profiler import startup_profiler
 from settings import DEFAULT_CONFIG_FILENAME
 
 
+@dataclass
+class WidgetFactory:
+    """
+    A resolved and validated widget which has not been constructed yet.
+    """
+    widget_name: str
+    widget_type: WidgetType
+    widget_options: dict
+
+    @property
+    def event_listener(self) -> Optional[type[QThread]]:
+        return self.widget_type.event_listener
+
+    def build(self) -> Optional[QWidget]:
+        try:
+            with startup_profiler.measure('widgets', self.widget_type.type_name):
+                widget = self.widget_type.widget_cls(**self.widget_options)
+            widget.widget_name = self.widget_name
+            return widget
+        except Exception:
+            logging.exception(f"Failed to build widget '{self.widget_name}'")
+
+
 class WidgetBuilder(QObject):
     def __init__(self, widget_configs: dict):
         super().__init__()
@@ -20,15 +43,29 @@ class WidgetBuilder(QObject):
         self._invalid_widget_options = {}
 
     def build_widgets(self, widget_map: dict[str, list[str]]) -> tuple[dict[str, list[QWidget]], set]:
+        widget_factories, widget_event_listeners = self.get_widget_factories(widget_map)
         bar_widgets = {}
 
-        for column, widget_names in widget_map.items():
-            built_widgets = [self._build_widget(widget_name) for widget_name in widget_names]
+        for column, factories in widget_factories.items():
+            built_widgets = [factory.build() for factory in factories]
             bar_widgets[column] = [widget for widget in built_widgets if widget is not None]
 
-        return bar_widgets, self._widget_event_listeners
+        return bar_widgets, widget_event_listeners
+
+    def build_widget(self, widget_name: str) -> Optional[QWidget]:
+        widget_factory = self.get_widget_factory(widget_name)
+        return widget_factory.build() if widget_factory else None
 
-    def _build_widget(self, widget_name: str) -> Optional[QWidget]:
+    def get_widget_factories(self, widget_map: dict[str, list[str]]) -> tuple[dict[str, list[WidgetFactory]], set]:
+        widget_factories = {}
+
+        for column, widget_names in widget_map.items():
+            factories = [self.get_widget_factory(widget_name) for widget_name in widget_names]
+            widget_factories[column] = [factory for factory in factories if factory is not None]
+
+        return widget_factories, self._widget_event_listeners
+
+    def get_widget_factory(self, widget_name: str) -> Optional[WidgetFactory]:
         widget_config = self._widget_configurations.get(widget_name, None)
 
         if (widget_name in self._invalid_widget_names) or (widget_name in self._invalid_widget_options):
@@ -38,28 +75,21 @@ class WidgetBuilder(QObject):
             logging.warning(f"No widget config could be found for widget '{widget_name}")
         else:
             try:
-                widget_module_str, widget_class_str = widget_config['type'].rsplit('.', 1)
-                widget_module = import_module(f"core.widgets.{widget_module_str}")
-                widget_cls = getattr(widget_module, widget_class_str)
-                widget_schema = getattr(widget_cls, 'validation_schema')
-                widget_event_listener = getattr(widget_cls, 'event_listener')
-
-                if type(widget_schema) != dict and not widget_schema:
-                    raise Exception(f"The widget {widget_cls.__name__} has no validation_schema")
+                widget_type = get_widget_type(widget_config['type'])
 
-                if widget_event_listener:
-                    self._widget_event_listeners.add(widget_event_listener)
+                if widget_type.event_listener:
+                    self._widget_event_listeners.add(widget_type.event_listener)
 
-                widget_options_validator = Validator(widget_schema)
                 widget_options = widget_config.get('options', {})
+                is_valid, normalized_options = widget_options_cache.normalize(widget_type, widget_options)
 
-                if not widget_options_validator.validate(widget_options, widget_schema):
-                    validation_errors = yaml.dump(widget_options_validator.errors)
+                if not is_valid:
+                    from yaml import dump
+                    validation_errors = dump(normalized_options)
                     indented_validation_errors = f"\n{validation_errors}".replace("\n", "\n      ")
                     self._invalid_widget_options[widget_name] = indented_validation_errors
                 else:
-                    normalized_options = widget_options_validator.normalized(widget_options)
-                    return widget_cls(**normalized_options)
+                    return WidgetFactory(widget_name, widget_type, normalized_options)
             except (AttributeError, ValueError, ModuleNotFoundError):
                 logging.exception(f"Failed to import widget with type {widget_config['type']}")
                 self._invalid_widget_types[widget_name] = widget_config['type']
@@ -0,0 +1,116 @@
+import functools
+import logging
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import cached_property
+from importlib import import_module
+from typing import Optional, Any
+from PyQt6.QtCore import QThread
+from core.utils.cache import hash_json
+
+WIDGET_MODULE_PREFIX = "core.widgets"
+
+
+@dataclass(frozen=True)
+class WidgetType:
+    type_name: str
+    widget_cls: type
+    validation_schema: dict
+    event_listener: Optional[type[QThread]]
+
+    @cached_property
+    def validator(self):
+        # cerberus is only imported once the options of a widget have to be validated
+        from cerberus import Validator
+        return Validator(self.validation_schema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_widget_type(type_name: str) -> WidgetType:
+    """
+    Resolves a widget type string such as 'yasb.cpu.CpuWidget' once per process. The widget module is
+    only imported the first time a configured widget requires it, after which the widget class, its
+    schema, its lazily compiled validator and its event listener are reused for all bars, screens and reloads.
+    """
+    widget_module_str, widget_class_str = type_name.rsplit('.', 1)
+    widget_module = import_module(f"{WIDGET_MODULE_PREFIX}.{widget_module_str}")
+    widget_cls = getattr(widget_module, widget_class_str)
+    widget_schema = getattr(widget_cls, 'validation_schema')
+    widget_event_listener = getattr(widget_cls, 'event_listener')
+
+    if type(widget_schema) != dict and not widget_schema:
+        raise Exception(f"The widget {widget_cls.__name__} has no validation_schema")
+
+    logging.debug(f"Registered widget type {type_name}")
+
+    return WidgetType(
+        type_name=type_name,
+        widget_cls=widget_cls,
+        validation_schema=widget_schema,
+        event_listener=widget_event_listener
+    )
+
+
+class WidgetOptionsCache:
+    """
+    Memoizes the validated and normalized options of widgets by their widget type and a hash of their raw
+    options, so identical widgets across bars, screens and config reloads are only validated once.
+    """
+
+    def __init__(self):
+        self._cache: dict[tuple[str, str], tuple[bool, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._cache)}
+
+    @staticmethod
+    def _get_cache_key(type_name: str, widget_options: dict) -> tuple[str, str]:
+        return type_name, hash_json(widget_options)
+
+    def normalize(self, widget_type: WidgetType, widget_options: dict) -> tuple[bool, Any]:
+        """
+        Returns a tuple of (True, normalized_options) if the options are valid, else (False, validation_errors).
+        Normalized options are copied as widgets are free to modify the options they are constructed with.
+        """
+        cache_key = self._get_cache_key(widget_type.type_name, widget_options)
+        cached_result = self._cache.get(cache_key)
+
+        if cached_result:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            if widget_type.validator.validate(widget_options):
+                cached_result = (True, widget_type.validator.normalized(widget_options))
+            else:
+                cached_result = (False, widget_type.validator.errors)
+
+            self._cache[cache_key] = cached_result
+
+        is_valid, result = cached_result
+        return is_valid, deepcopy(result)
+
+    def prune(self, widget_configs: dict[str, dict]) -> None:
+        """
+        Evicts the options of widgets which are no longer configured, so edited widgets do not accumulate entries
+        over the lifetime of the process.
+        """
+        configured_keys = {
+            self._get_cache_key(widget_config['type'], widget_config.get('options', {}))
+            for widget_config in widget_configs.values()
+            if isinstance(widget_config, dict) and 'type' in widget_config
+        }
+
+        for cache_key in self._cache.keys() - configured_keys:
+            del self._cache[cache_key]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+widget_options_cache = WidgetOptionsCache()
@@ -54,10 +54,10 @@ class ActiveWindowBorder(QWidget):
         self.update_active_border.connect(self._update_active_border)
         self.hide_active_border.connect(self._hide_active_border)
 
-        self._event_service.register_event(WinEvent.EventSystemForeground, self.update_active_border)
-        self._event_service.register_event(WinEvent.EventSystemMoveSizeStart, self.hide_active_border)
-        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.update_active_border)
-        self._event_service.register_event(WinEvent.EventObjectReorder, self.update_active_border)
+        self._event_service.register_event(WinEvent.EventSystemForeground, self.update_active_border, self)
+        self._event_service.register_event(WinEvent.EventSystemMoveSizeStart, self.hide_active_border, self)
+        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.update_active_border, self)
+        self._event_service.register_event(WinEvent.EventObjectReorder, self.update_active_border, self)
 
         self.show()
 
@@ -0,0 +1,46 @@
+import ctypes
+from typing import Optional
+from win32gui import GetForegroundWindow, GetDesktopWindow, GetShellWindow, GetWindowRect, GetClassName
+from win32api import MonitorFromWindow, GetMonitorInfo
+
+user32 = ctypes.windll.user32
+
+DESKTOP_SWITCHDESKTOP = 0x0100
+MONITOR_DEFAULTTONULL = 0
+DESKTOP_WINDOW_CLASSES = ["Progman", "WorkerW"]
+
+
+def is_session_locked() -> bool:
+    """
+    The input desktop cannot be opened or switched to while the workstation is locked
+    Documentation: https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-openinputdesktop
+    """
+    desktop = user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+
+    if not desktop:
+        return True
+
+    try:
+        return not user32.SwitchDesktop(desktop)
+    finally:
+        user32.CloseDesktop(desktop)
+
+
+def get_fullscreen_monitor_hwnd() -> Optional[int]:
+    """
+    Returns the handle of the monitor which is entirely covered by the foreground window, if any
+    """
+    hwnd = GetForegroundWindow()
+
+    if not hwnd or hwnd in [GetDesktopWindow(), GetShellWindow()] or GetClassName(hwnd) in DESKTOP_WINDOW_CLASSES:
+        return None
+
+    monitor_hwnd = MonitorFromWindow(hwnd, MONITOR_DEFAULTTONULL)
+
+    if not monitor_hwnd:
+        return None
+
+    monitor_rect = GetMonitorInfo(monitor_hwnd)['Monitor']
+    window_rect = GetWindowRect(hwnd)
+
+    return int(monitor_hwnd) if tuple(window_rect) == tuple(monitor_rect) else None
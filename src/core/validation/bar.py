@@ -7,6 +7,7 @@ BAR_DEFAULTS = {
     'window_flags': {'always_on_top': False, 'windows_app_bar': False},
     'dimensions': {'width': '100%', 'height': 30},
     'padding': {'top': 0, 'left': 0, 'bottom': 0, 'right': 0},
+    'progressive_build': {'enabled': False, 'chunk_size': 2},
     'widgets': {'left': [], 'center': [], 'right': []}
 }
 
@@ -117,6 +118,21 @@ BAR_SCHEMA = {
             },
             'default': BAR_DEFAULTS['padding']
         },
+        'progressive_build': {
+            'type': 'dict',
+            'schema': {
+                'enabled': {
+                    'type': 'boolean',
+                    'default': BAR_DEFAULTS['progressive_build']['enabled']
+                },
+                'chunk_size': {
+                    'type': 'integer',
+                    'min': 1,
+                    'default': BAR_DEFAULTS['progressive_build']['chunk_size']
+                }
+            },
+            'default': BAR_DEFAULTS['progressive_build']
+        },
         'widgets': {
             'type': 'dict',
             'schema': {
@@ -1,4 +1,5 @@
 from core.validation.bar import BAR_SCHEMA, BAR_DEFAULTS
+from settings import DEFAULT_MAX_CONCURRENT_PROCESSES
 
 CONFIG_SCHEMA = {
     'watch_config': {
@@ -9,6 +10,53 @@ CONFIG_SCHEMA = {
         'type': 'boolean',
         'default': True,
     },
+    'watch_debounce_interval': {
+        'type': 'integer',
+        'default': 250,
+        'min': 0,
+        'max': 10000
+    },
+    'application_stylesheet': {
+        'type': 'boolean',
+        'default': False
+    },
+    'max_concurrent_processes': {
+        'type': 'integer',
+        'default': DEFAULT_MAX_CONCURRENT_PROCESSES,
+        'min': 1,
+        'max': 64
+    },
+    'low_power_mode': {
+        'type': 'dict',
+        'schema': {
+            'enabled': {
+                'type': 'boolean',
+                'default': False
+            },
+            'on_battery': {
+                'type': 'boolean',
+                'default': True
+            },
+            'battery_threshold': {
+                'type': 'integer',
+                'default': 20,
+                'min': 0,
+                'max': 100
+            },
+            'interval_multiplier': {
+                'type': 'number',
+                'default': 2,
+                'min': 1,
+                'max': 10
+            }
+        },
+        'default': {
+            'enabled': False,
+            'on_battery': True,
+            'battery_threshold': 20,
+            'interval_multiplier': 2
+        }
+    },
     'bars': {
         'type': 'dict',
         'keysrules': {
@@ -2,9 +2,13 @@ DEFAULTS = {
     'label_max_length': None,
     'exec_options': {
         'run_cmd': None,
+        'run_provider': None,
         'run_once': False,
         'run_interval': 0,
-        'return_format': "json"
+        'return_format': "json",
+        'timeout': 10000,
+        'max_output_size': 65536,
+        'streaming': False
     },
     'callbacks': {
         'on_left': "toggle_label",
@@ -41,6 +45,12 @@ VALIDATION_SCHEMA = {
                 'nullable': True,
                 'default': DEFAULTS['exec_options']['run_cmd']
             },
+            'run_provider': {
+                'type': 'string',
+                'nullable': True,
+                'regex': r'^[\w.]+\.\w+$',
+                'default': DEFAULTS['exec_options']['run_provider']
+            },
             'run_once': {
                 'type': 'boolean',
                 'default': DEFAULTS['exec_options']['run_once']
@@ -54,6 +64,20 @@ VALIDATION_SCHEMA = {
                 'type': 'string',
                 'allowed': ['string', 'json'],
                 'default': DEFAULTS['exec_options']['return_format']
+            },
+            'timeout': {
+                'type': 'integer',
+                'default': DEFAULTS['exec_options']['timeout'],
+                'min': 1
+            },
+            'max_output_size': {
+                'type': 'integer',
+                'default': DEFAULTS['exec_options']['max_output_size'],
+                'min': 1
+            },
+            'streaming': {
+                'type': 'boolean',
+                'default': DEFAULTS['exec_options']['streaming']
             }
         },
         'default': DEFAULTS['exec_options']
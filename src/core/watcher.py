@@ -1,6 +1,8 @@
 import logging
-from os.path import basename
+import threading
+from os.path import basename, join
 from core.config import get_config_dir
+from core.utils.cache import hash_bytes
 from settings import DEFAULT_STYLES_FILENAME, DEFAULT_CONFIG_FILENAME
 from watchdog.observers import Observer
 from watchdog.events import PatternMatchingEventHandler, FileModifiedEvent
@@ -11,7 +13,7 @@ class FileModifiedEventHandler(PatternMatchingEventHandler):
     styles_file = DEFAULT_STYLES_FILENAME
     config_file = DEFAULT_CONFIG_FILENAME
 
-    def __init__(self, bar_manager: BarManager):
+    def __init__(self, bar_manager: BarManager, config_dir: str = None):
         super().__init__()
         self.bar_manager = bar_manager
         self._patterns = [
@@ -21,19 +23,80 @@ class FileModifiedEventHandler(PatternMatchingEventHandler):
         self._ignore_patterns = []
         self._ignore_directories = True
         self._case_sensitive = False
+        self._config_dir = config_dir or get_config_dir()
+        self._lock = threading.Lock()
+        self._pending_timers: dict[str, threading.Timer] = {}
+        self._file_hashes = {
+            file_name: self._hash_file(join(self._config_dir, file_name))
+            for file_name in self._patterns
+        }
+        self.num_events_emitted = 0
+        self.num_events_suppressed = 0
+
+    @property
+    def debounce_interval(self) -> int:
+        return self.bar_manager.config['watch_debounce_interval']
 
     def on_modified(self, event: FileModifiedEvent):
         modified_file = basename(event.src_path)
 
         if modified_file == self.styles_file and self.bar_manager.config['watch_stylesheet']:
-            self.bar_manager.styles_modified.emit()
+            self._schedule_emit(modified_file, event.src_path)
         elif modified_file == self.config_file and self.bar_manager.config['watch_config']:
+            self._schedule_emit(modified_file, event.src_path)
+
+    def _schedule_emit(self, modified_file: str, file_path: str) -> None:
+        # Coalesces bursts of modify events for the same file into a single check once the file settles
+        with self._lock:
+            pending_timer = self._pending_timers.get(modified_file)
+
+            if pending_timer:
+                pending_timer.cancel()
+                self.num_events_suppressed += 1
+
+            timer = threading.Timer(self.debounce_interval / 1000, self._emit_if_changed, (modified_file, file_path))
+            timer.daemon = True
+            self._pending_timers[modified_file] = timer
+            timer.start()
+
+    def _emit_if_changed(self, modified_file: str, file_path: str) -> None:
+        with self._lock:
+            self._pending_timers.pop(modified_file, None)
+            file_hash = self._hash_file(file_path)
+
+            if file_hash is None or file_hash == self._file_hashes.get(modified_file):
+                self.num_events_suppressed += 1
+                logging.debug(
+                    f"Ignored modify event for unchanged file '{modified_file}' "
+                    f"(emitted: {self.num_events_emitted}, suppressed: {self.num_events_suppressed})"
+                )
+                return
+
+            self._file_hashes[modified_file] = file_hash
+            self.num_events_emitted += 1
+
+        logging.info(
+            f"Detected changes to file '{modified_file}' "
+            f"(emitted: {self.num_events_emitted}, suppressed: {self.num_events_suppressed})"
+        )
+
+        if modified_file == self.styles_file:
+            self.bar_manager.styles_modified.emit()
+        elif modified_file == self.config_file:
             self.bar_manager.config_modified.emit()
 
+    @staticmethod
+    def _hash_file(file_path: str):
+        try:
+            with open(file_path, 'rb') as file_stream:
+                return hash_bytes(file_stream.read())
+        except OSError:
+            return None
+
 
 def create_observer(bar_manager: BarManager):
-    event_handler = FileModifiedEventHandler(bar_manager)
     config_path = get_config_dir()
+    event_handler = FileModifiedEventHandler(bar_manager, config_path)
     observer = Observer()
     observer.schedule(event_handler, path=config_path, recursive=False)
     logging.info(f"Created file watcher for path {config_path}")
@@ -1,14 +1,21 @@
 import logging
-import subprocess
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QFrame
-from PyQt6.QtGui import QMouseEvent
-from PyQt6.QtCore import QTimer, QThread, Qt
-from typing import Union
+import time
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QFrame, QLabel
+from PyQt6.QtGui import QMouseEvent, QShowEvent, QHideEvent
+from PyQt6.QtCore import QThread, Qt
+from typing import Any, Optional, Union
+from core.utils.metric_provider import get_metric_provider
+from core.utils.process_runner import process_runner
+from core.utils.render_queue import render_queue
+from core.utils.tick_scheduler import tick_scheduler
+from core.utils.utilities import build_class_name, set_class_property
+from core.utils.visibility import visibility_monitor
 
 
 class BaseWidget(QWidget):
     validation_schema: dict = None
     event_listener: QThread = None
+    metric_source: str = None
 
     def __init__(
             self,
@@ -21,13 +28,19 @@ class BaseWidget(QWidget):
         self.widget_layout = QHBoxLayout()
         self.timer_interval = timer_interval
         self.bar_id = None
+        self.widget_name = None
+        self.metric_snapshot = None
+        self.metric_fields: Optional[frozenset[str]] = None
+        self.metric_stale = False
+        self._metric_provider = None
+        self._is_timer_started = False
+        self._suspend_reasons: set[str] = set()
+        self._suspended_at = None
+        self._pending_renders: dict[QLabel, dict[str, str]] = {}
+        self._rendered_labels: dict[QLabel, dict[str, str]] = {}
+        self._widget_frame_class = f"widget {class_name}" if class_name else "widget"
+        self._widget_frame.setProperty("class", self._widget_frame_class)
 
-        if class_name:
-            self._widget_frame.setProperty("class", f"widget {class_name}")
-        else:
-            self._widget_frame.setProperty("class", "widget")
-
-        self.timer = QTimer(self)
         self.mousePressEvent = self._handle_mouse_events
 
         self.widget_layout.setSpacing(0)
@@ -54,12 +67,120 @@ class BaseWidget(QWidget):
     def register_callback(self, callback_name, fn):
         self.callbacks[callback_name] = fn
 
+    def render_label(self, label: QLabel, text: str = None, class_name: str = None):
+        """
+        Queues an update of the label's text and/or class. Pending updates of all widgets are applied together
+        once control returns to the event loop, and updates which would not change the label are skipped.
+        """
+        pending_render = self._pending_renders.setdefault(label, {})
+
+        for key, value in (('text', text), ('class', class_name)):
+            if value is not None:
+                if key in pending_render:
+                    render_queue.num_coalesced += 1
+                pending_render[key] = value
+
+        render_queue.schedule(self)
+
+    def apply_renders(self):
+        pending_renders = self._pending_renders
+        self._pending_renders = {}
+
+        for label, pending_render in pending_renders.items():
+            # Labels are compared against the last values rendered through the queue, seeded from their initial state
+            rendered_label = self._rendered_labels.setdefault(label, {
+                'text': label.text(),
+                'class': label.property("class")
+            })
+
+            if 'text' in pending_render:
+                if pending_render['text'] == rendered_label['text']:
+                    render_queue.num_skipped += 1
+                else:
+                    label.setText(pending_render['text'])
+                    rendered_label['text'] = pending_render['text']
+                    render_queue.num_applied += 1
+
+            if 'class' in pending_render:
+                if pending_render['class'] == rendered_label['class']:
+                    render_queue.num_skipped += 1
+                else:
+                    set_class_property(label, pending_render['class'])
+                    rendered_label['class'] = pending_render['class']
+                    render_queue.num_applied += 1
+
     def start_timer(self):
+        self._is_timer_started = True
+
+        if self._suspend_reasons:
+            return
+
+        if self.metric_source:
+            self._start_metric_subscription()
+            return
+
+        # Timer callbacks are driven by the shared tick scheduler rather than a timer per widget
         if self.timer_interval and self.timer_interval > 0:
-            self.timer.timeout.connect(self._timer_callback)
-            self.timer.start(self.timer_interval)
+            tick_scheduler.subscribe(self, self.timer_interval, self._timer_callback)
         self._timer_callback()
 
+    def stop_timer(self):
+        tick_scheduler.unsubscribe(self)
+
+        if self._metric_provider:
+            self._metric_provider.unsubscribe(self)
+            self._metric_provider = None
+
+    def suspend_timer(self, reason: str):
+        """
+        Stops timer callbacks while the widget cannot be seen, e.g. because it is 'hidden' or its bar is 'occluded'
+        """
+        if not self._suspend_reasons and self._is_timer_started:
+            self._suspended_at = time.monotonic()
+            self.stop_timer()
+
+        self._suspend_reasons.add(reason)
+
+    def resume_timer(self, reason: str):
+        if reason not in self._suspend_reasons:
+            return
+
+        self._suspend_reasons.discard(reason)
+
+        if not self._suspend_reasons and self._is_timer_started:
+            # Restarting the timer forces an immediate refresh of the widget
+            if self._suspended_at is not None and self.timer_interval and self.timer_interval > 0:
+                suspended_ms = (time.monotonic() - self._suspended_at) * 1000
+                visibility_monitor.record_suspension(int(suspended_ms // self.timer_interval))
+
+            self._suspended_at = None
+            self.start_timer()
+
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+        self.resume_timer("hidden")
+
+    def hideEvent(self, event: QHideEvent):
+        super().hideEvent(event)
+        self.suspend_timer("hidden")
+
+    def _start_metric_subscription(self):
+        # Widgets displaying the same metric source at the same interval share a single provider across all bars.
+        # Widgets without a positive interval are sampled once by a provider which is not scheduled.
+        interval = self.timer_interval if self.timer_interval and self.timer_interval > 0 else 0
+        self._metric_provider = get_metric_provider(self.metric_source, interval)
+        self._metric_provider.subscribe(self, self._metric_callback, self.metric_fields)
+
+    def _metric_callback(self, snapshot: Any, is_stale: bool):
+        if is_stale != self.metric_stale:
+            self.metric_stale = is_stale
+            # Stale widgets can be styled via the '.widget.stale' selector until their next sample arrives
+            set_class_property(self._widget_frame, build_class_name(self._widget_frame_class, is_stale and "stale"))
+
+        if snapshot is not self.metric_snapshot:
+            self.metric_snapshot = snapshot
+            self._timer_callback()
+
     def _handle_mouse_events(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             self._run_callback(self.callback_left)
@@ -89,7 +210,7 @@ class BaseWidget(QWidget):
         self._run_callback(self.callback_timer)
 
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
-        subprocess.Popen([cmd, *cmd_args] if cmd_args else [cmd], shell=True)
+        process_runner.start([cmd, *cmd_args] if cmd_args else [cmd], shell=True)
 
     def _cb_do_nothing(self):
         pass
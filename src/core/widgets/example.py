@@ -1,4 +1,5 @@
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.validation.widgets.example import EXAMPLE_VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 
@@ -17,6 +18,8 @@ class ExampleWidget(BaseWidget):
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -53,5 +56,5 @@ class ExampleWidget(BaseWidget):
     def _update_label(self):
         # Update the active label at each timer interval
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label.setText(active_label_content)
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
+        self.render_label(active_label, active_label_template.render())
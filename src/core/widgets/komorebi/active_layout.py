@@ -6,6 +6,7 @@ from core.utils.win32.utilities import get_monitor_hwnd
 from core.event_service import EventService
 from core.event_enums import KomorebiEvent
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.utils.komorebi.client import KomorebiClient
 from core.validation.widgets.komorebi.active_layout import VALIDATION_SCHEMA
 
@@ -44,7 +45,7 @@ class ActiveLayoutWidget(BaseWidget):
 
     def __init__(self, label: str, layout_icons: dict[str, str], hide_if_offline: bool, callbacks: dict[str, str]):
         super().__init__(class_name="komorebi-active-layout")
-        self._label = label
+        self._label = compile_template(label)
         self._layout_icons = layout_icons
         self._layouts = deque([
             'bsp', 'columns', 'rows', 'vertical-stack', 'horizontal-stack', 'ultrawide-vertical-stack'
@@ -108,11 +109,11 @@ class ActiveLayoutWidget(BaseWidget):
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
         self.k_signal_layout_change.connect(self._on_komorebi_layout_change_event)
 
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect,  self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect,  self.k_signal_connect, self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, self)
 
         for event_type in active_layout_change_event_watchlist:
-            self._event_service.register_event(event_type, self.k_signal_layout_change)
+            self._event_service.register_event(event_type, self.k_signal_layout_change, self)
 
     def _on_komorebi_connect_event(self, state: dict) -> None:
         self._update_active_layout(state, is_connect_event=True)
@@ -141,8 +142,9 @@ class ActiveLayoutWidget(BaseWidget):
                     while self._layouts[0] != conn_layout_cmd:
                         self._layouts.rotate(1)
 
-                self._active_layout_text.setText(
-                    self._label.replace("{icon}", layout_icon).replace("{layout_name}", layout_name)
+                self.render_label(
+                    self._active_layout_text,
+                    self._label.render(icon=layout_icon, layout_name=layout_name)
                 )
 
                 if self._active_layout_text.isHidden():
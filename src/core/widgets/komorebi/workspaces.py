@@ -4,9 +4,11 @@ from PyQt6.QtCore import pyqtSignal
 from typing import Literal
 from contextlib import suppress
 from core.utils.win32.utilities import get_monitor_hwnd
+from core.utils.utilities import build_class_name, set_class_property
 from core.event_service import EventService
 from core.event_enums import KomorebiEvent
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.utils.komorebi.client import KomorebiClient
 from core.validation.widgets.komorebi.workspaces import VALIDATION_SCHEMA
 
@@ -36,8 +38,7 @@ class WorkspaceButton(QPushButton):
 
     def update_and_redraw(self, status: WorkspaceStatus):
         self.status = status
-        self.setProperty("class", f"ws-btn {status.lower()}")
-        self.setStyleSheet('')
+        set_class_property(self, build_class_name("ws-btn", status.lower()))
 
     def activate_workspace(self):
         try:
@@ -66,8 +67,8 @@ class WorkspaceWidget(BaseWidget):
 
         self._event_service = EventService()
         self._komorebic = KomorebiClient()
-        self._label_workspace_btn = label_workspace_btn
-        self._label_default_name = label_default_name
+        self._label_workspace_btn = compile_template(label_workspace_btn)
+        self._label_default_name = compile_template(label_default_name)
         self._label_zero_index = label_zero_index
         self._komorebi_screen = None
         self._komorebi_workspaces = []
@@ -124,9 +125,9 @@ class WorkspaceWidget(BaseWidget):
         self.k_signal_update.connect(self._on_komorebi_update_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
 
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect, self)
+        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect, self)
+        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update, self)
 
     def _reset(self):
         self._komorebi_state = None
@@ -249,11 +250,11 @@ class WorkspaceWidget(BaseWidget):
 
         ws_index = workspace_index if self._label_zero_index else workspace_index + 1
         ws_monitor_index = monitor_index if self._label_zero_index else monitor_index + 1
-        ws_name = workspace['name'] if workspace['name'] else self._label_default_name.format(
+        ws_name = workspace['name'] if workspace['name'] else self._label_default_name.render(
             index=ws_index,
             monitor_index=ws_monitor_index
         )
-        return self._label_workspace_btn.format(
+        return self._label_workspace_btn.render(
             name=ws_name,
             index=ws_index,
             monitor_index=ws_monitor_index
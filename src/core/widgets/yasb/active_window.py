@@ -2,6 +2,7 @@ import logging
 from settings import APP_BAR_TITLE
 from core.utils.win32.windows import WinEvent
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.event_service import EventService
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QLabel
@@ -46,9 +47,9 @@ class ActiveWindowWidget(BaseWidget):
 
         self._win_info = None
         self._show_alt = False
-        self._label = label
-        self._label_alt = label_alt
-        self._active_label = label
+        self._label = compile_template(label)
+        self._label_alt = compile_template(label_alt)
+        self._active_label = self._label
         self._label_no_window = label_no_window
         self._monitor_exclusive = monitor_exclusive
         self._max_length = max_length
@@ -78,9 +79,9 @@ class ActiveWindowWidget(BaseWidget):
         self.callback_middle = callbacks['on_middle']
 
         self.foreground_change.connect(self._on_focus_change_event)
-        self._event_service.register_event(WinEvent.EventSystemForeground, self.foreground_change)
-        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.foreground_change)
-        self._event_service.register_event(WinEvent.EventSystemCaptureEnd, self.foreground_change)
+        self._event_service.register_event(WinEvent.EventSystemForeground, self.foreground_change, self)
+        self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.foreground_change, self)
+        self._event_service.register_event(WinEvent.EventSystemCaptureEnd, self.foreground_change, self)
 
     def _toggle_title_text(self) -> None:
         self._show_alt = not self._show_alt
@@ -117,7 +118,7 @@ class ActiveWindowWidget(BaseWidget):
                 if self._max_length and len(win_info['title']) > self._max_length:
                     truncated_title = f"{win_info['title'][:self._max_length]}{self._max_length_ellipsis}"
                     win_info['title'] = truncated_title
-                    self._window_title_text.setText(self._label_no_window)
+                    self.render_label(self._window_title_text, self._label_no_window)
 
                 self._win_info = win_info
                 self._update_text()
@@ -131,6 +132,6 @@ class ActiveWindowWidget(BaseWidget):
 
     def _update_text(self):
         try:
-            self._window_title_text.setText(self._active_label.format(win=self._win_info))
+            self.render_label(self._window_title_text, self._active_label.render(win=self._win_info))
         except Exception:
-            self._window_title_text.setText(self._active_label)
+            self.render_label(self._window_title_text, self._active_label.template)
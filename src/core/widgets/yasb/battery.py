@@ -1,7 +1,8 @@
 import psutil
-import humanize
 from datetime import timedelta
 from core.widgets.base import BaseWidget
+from core.utils.utilities import build_class_name
+from core.utils.power import power_monitor
 from core.validation.widgets.yasb.battery import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 from typing import Union
@@ -9,6 +10,7 @@ from typing import Union
 
 class BatteryWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
+    metric_source = "battery"
 
     def __init__(
             self,
@@ -76,7 +78,11 @@ class BatteryWidget(BaseWidget):
             time_left = "unlimited"
         elif type(secs_left) == int:
             time_left = timedelta(seconds=secs_left)
-            time_left = humanize.naturaldelta(time_left) if self._time_remaining_natural else str(time_left)
+            if self._time_remaining_natural:
+                from humanize import naturaldelta
+                time_left = naturaldelta(time_left)
+            else:
+                time_left = str(time_left)
         else:
             time_left = "unknown"
 
@@ -98,7 +104,8 @@ class BatteryWidget(BaseWidget):
 
     def _get_charging_icon(self, threshold: str):
         if self._battery_state.power_plugged:
-            if self._icon_charging_blink and self._blink:
+            # The charging icon does not blink in low power mode
+            if self._icon_charging_blink and self._blink and not power_monitor.is_low_power:
                 empty_charging_icon = len(self._status_icons["icon_charging"]) * " "
                 icon_str = self._icon_charging_format \
                     .replace("{charging_icon}", empty_charging_icon) \
@@ -114,16 +121,19 @@ class BatteryWidget(BaseWidget):
             return self._status_icons[f"icon_{threshold}"]
 
     def _update_label(self):
+        if self.metric_snapshot is None:
+            return
+
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label.setText(active_label_content)
 
-        self._battery_state = psutil.sensors_battery()
+        self._battery_state = self.metric_snapshot
 
         threshold = self._get_battery_threshold()
         time_remaining = self._get_time_remaining()
         is_charging_str = "yes" if self._battery_state.power_plugged else "no"
         charging_icon = self._get_charging_icon(threshold)
+        # Four str.replace calls on the short battery label are cheaper than rendering a compiled label template
         battery_status = active_label_content\
             .replace("{percent}", str(self._battery_state.percent)) \
             .replace("{time_remaining}", time_remaining) \
@@ -134,6 +144,4 @@ class BatteryWidget(BaseWidget):
             threshold = "charging"
 
         alt_class = "alt" if self._show_alt_label else ""
-        active_label.setText(battery_status)
-        active_label.setProperty("class", f"label {alt_class} status-{threshold}")
-        active_label.setStyleSheet('')
+        self.render_label(active_label, battery_status, build_class_name("label", alt_class, f"status-{threshold}"))
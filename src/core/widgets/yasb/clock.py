@@ -1,12 +1,37 @@
+import functools
+import math
 import re
-import pytz
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_datetime_template
+from core.utils.power import power_monitor
+from core.utils.tick_scheduler import tick_scheduler
 from core.validation.widgets.yasb.clock import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import QTimer, Qt
 from datetime import datetime
-from tzlocal import get_localzone_name
 from itertools import cycle
 
+# Granularity (in seconds) of the strftime directives which change every second, minute or hour.
+# Formats without any of these directives, e.g. date-only formats, are updated every hour.
+DIRECTIVE_GRANULARITIES = {
+    **{directive: 1 for directive in "STXcrsf"},
+    **{directive: 60 for directive in "MR"},
+}
+DEFAULT_GRANULARITY = 3600
+
+# Updates are scheduled slightly after each boundary, so the label never renders the previous second or minute
+BOUNDARY_SLACK_MS = 2
+
+
+@functools.lru_cache(maxsize=None)
+def get_update_granularity(datetime_format: str) -> int:
+    """
+    Returns the number of seconds between changes of the given strftime format, i.e. 1, 60 or 3600
+    """
+    directives = re.findall(r'%[-#_^0]*(.)', datetime_format)
+    return min((DIRECTIVE_GRANULARITIES.get(directive, DEFAULT_GRANULARITY) for directive in directives),
+               default=DEFAULT_GRANULARITY)
+
 
 class ClockWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
@@ -21,12 +46,24 @@ class ClockWidget(BaseWidget):
     ):
         super().__init__(update_interval, class_name="clock-widget")
         self._active_tz = None
-        self._timezones = cycle(timezones if timezones else [get_localzone_name()])
+        self._active_tz_info = None
+        self._timezones = cycle(timezones if timezones else [self._get_local_timezone()])
         self._active_datetime_format_str = ''
         self._active_datetime_format = None
 
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_datetime_template(label)
+        self._label_alt_template = compile_datetime_template(label_alt)
+        self._update_enabled = update_interval > 0
+
+        # Updates are driven by a single-shot timer aligned to the next boundary of the active datetime format
+        # rather than by the shared tick scheduler, whose intervals are aligned to when the application started
+        self._boundary_timer = QTimer(self)
+        self._boundary_timer.setSingleShot(True)
+        self._boundary_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._boundary_timer.timeout.connect(self._timer_callback)
+        power_monitor.changed.connect(self._on_low_power_changed)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -50,9 +87,18 @@ class ClockWidget(BaseWidget):
         self._show_alt_label = False
 
         self._next_timezone()
-        self._update_label()
         self.start_timer()
 
+    def start_timer(self):
+        self._is_timer_started = True
+
+        if not self._suspend_reasons:
+            self._update_label()
+
+    def stop_timer(self):
+        super().stop_timer()
+        self._boundary_timer.stop()
+
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
 
@@ -68,21 +114,56 @@ class ClockWidget(BaseWidget):
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
-            datetime_format_search = re.search('\{(.*)}', active_label_content)
-            datetime_format_str = datetime_format_search.group()
-            datetime_format = datetime_format_search.group(1)
-            datetime_now = pytz.utc.localize(datetime.utcnow()).astimezone(pytz.timezone(self._active_tz))
-            format_label_content = active_label_content.replace(
-                datetime_format_str,
-                datetime_now.strftime(datetime_format)
-            )
-            active_label.setText(format_label_content)
+            datetime_now = datetime.now(self._get_active_tz_info())
+            format_label_content = active_label_template.render(datetime=datetime_now)
         except Exception:
-            active_label.setText(active_label_content)
+            self._boundary_timer.stop()
+            format_label_content = active_label_content
+        else:
+            if active_label_template.datetime_format is None:
+                self._boundary_timer.stop()
+            else:
+                self._schedule_next_update(datetime_now, get_update_granularity(active_label_template.datetime_format))
+
+        self.render_label(active_label, format_label_content)
+
+    def _schedule_next_update(self, datetime_now: datetime, granularity: int):
+        # In low power mode, boundaries are coarsened by the interval multiplier like every scheduled widget update,
+        # e.g. a clock displaying seconds is updated every other second with an interval multiplier of 2
+        granularity = math.ceil(granularity * tick_scheduler.interval_multiplier)
+        self.timer_interval = granularity * 1000
+
+        if not self._update_enabled or not self._is_timer_started or self._suspend_reasons:
+            return
+
+        # Boundaries are computed in the active timezone, as some timezones are offset by a fraction of an hour
+        seconds_of_day = datetime_now.hour * 3600 + datetime_now.minute * 60 + datetime_now.second
+        elapsed_seconds = seconds_of_day % granularity + datetime_now.microsecond / 1e6
+        self._boundary_timer.start(math.ceil((granularity - elapsed_seconds) * 1000) + BOUNDARY_SLACK_MS)
+
+    def _on_low_power_changed(self, _is_low_power: bool):
+        # The pending update is rescheduled to a boundary of the new granularity
+        if self._boundary_timer.isActive():
+            self._update_label()
+
+    def _get_active_tz_info(self):
+        # Timezones are resolved once per active timezone instead of on every label update
+        if self._active_tz_info is None:
+            import pytz
+            self._active_tz_info = pytz.timezone(self._active_tz)
+        return self._active_tz_info
+
+    @staticmethod
+    def _get_local_timezone() -> str:
+        # tzlocal is only needed when no timezones have been configured
+        from tzlocal import get_localzone_name
+        return get_localzone_name()
 
     def _next_timezone(self):
         self._active_tz = next(self._timezones)
+        self._active_tz_info = None
         self.setToolTip(self._active_tz)
         self._update_label()
@@ -1,12 +1,43 @@
-import psutil
 from collections import deque
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.validation.widgets.yasb.cpu import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 
+# Snapshot fields required by each part of the info dict which can be referenced by labels
+CPU_INFO_FIELDS = {
+    ('cores',): {'cores_physical', 'cores_total'},
+    ('freq',): {'freq'},
+    ('percent', 'core'): {'percent_per_core'},
+    ('percent', 'total'): {'percent'},
+    ('stats',): {'stats'},
+    ('histograms', 'cpu_freq'): {'freq'},
+    ('histograms', 'cpu_percent'): {'percent'},
+    ('histograms', 'cores'): {'percent_per_core'}
+}
+
+
+def get_cpu_info_paths(field_paths: frozenset[tuple]) -> set[tuple]:
+    """
+    Returns the parts of the info dict referenced by the given label field paths, e.g. '{info[percent]}' references
+    both ('percent', 'core') and ('percent', 'total'), while '{info[percent][total]:.1f}' only references the latter
+    """
+    info_paths = set()
+
+    for name, *path in field_paths:
+        if name != 'info':
+            continue
+
+        for info_path in CPU_INFO_FIELDS.keys():
+            if tuple(path[:len(info_path)]) == info_path or info_path[:len(path)] == tuple(path):
+                info_paths.add(info_path)
+
+    return info_paths
+
 
 class CpuWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
+    metric_source = "cpu"
 
     def __init__(
             self,
@@ -25,6 +56,12 @@ class CpuWidget(BaseWidget):
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
+
+        # Only the parts of the info dict referenced by either label are sampled and computed on each update
+        self._info_paths = get_cpu_info_paths(self._label_template.field_paths | self._label_alt_template.field_paths)
+        self.metric_fields = frozenset().union(*(CPU_INFO_FIELDS[info_path] for info_path in self._info_paths))
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -59,15 +96,29 @@ class CpuWidget(BaseWidget):
         self._update_label()
 
     def _update_label(self):
+        # Keeps the label empty until the first sample, rather than showing the raw label when toggled before it
+        if self.metric_snapshot is None:
+            return
+
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label.setText(active_label_content)
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
             info = self._get_cpu_info()
-            active_label.setText(active_label_content.format(info=info))
+            self.render_label(active_label, active_label_template.render(info=info))
         except Exception:
-            active_label.setText(active_label_content)
+            self.render_label(active_label, active_label_content)
+
+    def _metric_callback(self, snapshot: dict, is_stale: bool):
+        # Histories only advance when a new snapshot is sampled, not when the label is toggled or goes stale
+        # Fields missing from a snapshot, e.g. the frequency on systems which do not report it, are not recorded
+        if snapshot is not self.metric_snapshot:
+            if ('histograms', 'cpu_freq') in self._info_paths and snapshot.get('freq'):
+                self._cpu_freq_history.append(snapshot['freq'].current)
+            if ('histograms', 'cpu_percent') in self._info_paths and 'percent' in snapshot:
+                self._cpu_perc_history.append(snapshot['percent'])
+        super()._metric_callback(snapshot, is_stale)
 
     def _get_histogram_bar(self, num, num_min, num_max):
         bar_index = int((num - num_min) / (num_max - num_min) * 10)
@@ -75,46 +126,50 @@ class CpuWidget(BaseWidget):
         return self._histogram_icons[bar_index]
 
     def _get_cpu_info(self) -> dict:
-        cpu_freq = psutil.cpu_freq()
-        cpu_stats = psutil.cpu_stats()
-        min_freq = cpu_freq.min
-        max_freq = cpu_freq.max
-        current_freq = cpu_freq.current
-        current_perc = psutil.cpu_percent()
-        cores_perc = psutil.cpu_percent(percpu=True)
-
-        self._cpu_freq_history.append(current_freq)
-        self._cpu_perc_history.append(current_perc)
-
-        return {
-            'cores': {
-                'physical': psutil.cpu_count(logical=False),
-                'total': psutil.cpu_count(logical=True)
-            },
-            'freq': {
-                'min': min_freq,
-                'max': max_freq,
-                'current': current_freq
-            },
-            'percent': {
-                'core': cores_perc,
-                'total': current_perc
-            },
-            'stats': {
-                'context_switches': cpu_stats.ctx_switches,
-                'interrupts': cpu_stats.interrupts,
-                'soft_interrupts': cpu_stats.soft_interrupts,
-                'sys_calls': cpu_stats.syscalls
-            },
-            'histograms': {
-                'cpu_freq': "".join([
-                    self._get_histogram_bar(freq, min_freq, max_freq) for freq in self._cpu_freq_history
-                ]).encode('utf-8').decode('unicode_escape'),
-                'cpu_percent': "".join([
-                    self._get_histogram_bar(percent, 0, 100) for percent in self._cpu_perc_history
-                ]).encode('utf-8').decode('unicode_escape'),
-                'cores': "".join([
-                    self._get_histogram_bar(percent, 0, 100) for percent in cores_perc
-                ]).encode('utf-8').decode('unicode_escape'),
+        snapshot = self.metric_snapshot
+        info = {'percent': {}, 'histograms': {}}
+
+        if ('cores',) in self._info_paths:
+            info['cores'] = {
+                'physical': snapshot['cores_physical'],
+                'total': snapshot['cores_total']
             }
-        }
+
+        if ('freq',) in self._info_paths:
+            info['freq'] = {
+                'min': snapshot['freq'].min,
+                'max': snapshot['freq'].max,
+                'current': snapshot['freq'].current
+            }
+
+        if ('percent', 'core') in self._info_paths:
+            info['percent']['core'] = snapshot['percent_per_core']
+
+        if ('percent', 'total') in self._info_paths:
+            info['percent']['total'] = snapshot['percent']
+
+        if ('stats',) in self._info_paths:
+            info['stats'] = {
+                'context_switches': snapshot['stats'].ctx_switches,
+                'interrupts': snapshot['stats'].interrupts,
+                'soft_interrupts': snapshot['stats'].soft_interrupts,
+                'sys_calls': snapshot['stats'].syscalls
+            }
+
+        if ('histograms', 'cpu_freq') in self._info_paths:
+            info['histograms']['cpu_freq'] = "".join([
+                self._get_histogram_bar(freq, snapshot['freq'].min, snapshot['freq'].max)
+                for freq in self._cpu_freq_history
+            ]).encode('utf-8').decode('unicode_escape')
+
+        if ('histograms', 'cpu_percent') in self._info_paths:
+            info['histograms']['cpu_percent'] = "".join([
+                self._get_histogram_bar(percent, 0, 100) for percent in self._cpu_perc_history
+            ]).encode('utf-8').decode('unicode_escape')
+
+        if ('histograms', 'cores') in self._info_paths:
+            info['histograms']['cores'] = "".join([
+                self._get_histogram_bar(percent, 0, 100) for percent in snapshot['percent_per_core']
+            ]).encode('utf-8').decode('unicode_escape')
+
+        return info
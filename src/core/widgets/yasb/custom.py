@@ -1,7 +1,9 @@
-import subprocess
-import json
 from PyQt6.QtWidgets import QLabel
 from core.widgets.base import BaseWidget
+from core.utils.command_cache import get_command_cache, get_provider_cache
+from core.utils.command_stream import get_command_stream
+from core.utils.process_runner import process_runner
+from core.utils.label_template import compile_template
 from core.validation.widgets.yasb.custom import VALIDATION_SCHEMA
 
 
@@ -22,10 +24,40 @@ class CustomWidget(BaseWidget):
         self._exec_data = None
         self._exec_cmd = exec_options['run_cmd'].split(" ") if exec_options.get('run_cmd', False) else None
         self._exec_return_type = exec_options['return_format']
+        self._command_cache = None
+        self._command_stream = None
+
+        if exec_options['run_provider']:
+            # Data providers are called in-process, so cheap data sources do not spawn a process per update
+            self._command_cache = get_provider_cache(exec_options['run_provider'], exec_options['timeout'])
+        elif self._exec_cmd and exec_options['streaming']:
+            # Streaming commands are started once and update the widget with every line they write
+            self._command_stream = get_command_stream(
+                self._exec_cmd,
+                self._exec_return_type,
+                exec_options['max_output_size']
+            )
+        elif self._exec_cmd:
+            # Widgets running the same command share its output, so it is spawned and parsed once per interval
+            self._command_cache = get_command_cache(
+                self._exec_cmd,
+                self._exec_return_type,
+                exec_options['timeout'],
+                exec_options['max_output_size']
+            )
+
+        if self._command_cache:
+            self._command_cache.subscribe(
+                self,
+                self._on_exec_data,
+                0 if exec_options['run_once'] else exec_options['run_interval']
+            )
 
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -46,7 +78,9 @@ class CustomWidget(BaseWidget):
         self._label_alt.hide()
         self._update_label()
 
-        if exec_options['run_once']:
+        if self._command_stream:
+            self._command_stream.subscribe(self, self._on_exec_data)
+        elif exec_options['run_once']:
             self._exec_callback()
         else:
             self.start_timer()
@@ -72,25 +106,28 @@ class CustomWidget(BaseWidget):
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
-            active_label.setText(self._truncate_label(active_label_content.format(data=self._exec_data)))
+            self.render_label(active_label, self._truncate_label(active_label_template.render(data=self._exec_data)))
         except Exception:
-            active_label.setText(self._truncate_label(active_label_content))
+            self.render_label(active_label, self._truncate_label(active_label_content))
 
-    def _exec_callback(self):
-        self._exec_data = None
+    @property
+    def exec_stats(self) -> dict:
+        if self._command_stream:
+            return self._command_stream.stats
 
-        if self._exec_cmd:
-            proc = subprocess.Popen(self._exec_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=True)
-            output = proc.stdout.read()
+        return self._command_cache.stats if self._command_cache else {}
 
-            if self._exec_return_type == "json":
-                self._exec_data = json.loads(output)
-            else:
-                self._exec_data = output.decode('utf-8').strip()
+    def _exec_callback(self):
+        # Commands run in the background and the label is updated once their output arrives
+        if self._command_cache:
+            self._command_cache.request(self)
 
-            self._update_label()
+    def _on_exec_data(self, exec_data):
+        self._exec_data = exec_data
+        self._update_label()
 
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
         # Overrides the default 'exec' callback from BaseWidget to allow for data formatting
@@ -102,4 +139,4 @@ class CustomWidget(BaseWidget):
                 except KeyError:
                     formatted_cmd_args.append(cmd_args)
             cmd_args = formatted_cmd_args
-        subprocess.Popen([cmd, *cmd_args] if cmd_args else [cmd], shell=True)
+        process_runner.start([cmd, *cmd_args] if cmd_args else [cmd], shell=True)
@@ -1,13 +1,30 @@
+import functools
 import logging
-import psutil
-from humanize import naturalsize
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template, format_size
+from core.utils.utilities import build_class_name
 from core.validation.widgets.yasb.memory import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 
+# Total sizes stay the same on every update, so they are formatted once rather than on each tick
+_format_total_size = functools.lru_cache(maxsize=8)(format_size)
+
+# Label options computed from the virtual and swap memory snapshots. Only options referenced by the active label
+# are formatted on each update, and swap memory is only sampled if either label references it.
+MEMORY_LABEL_OPTIONS = {
+    'virtual_mem_free': lambda virtual_mem, _swap_mem: format_size(virtual_mem.free),
+    'virtual_mem_percent': lambda virtual_mem, _swap_mem: virtual_mem.percent,
+    'virtual_mem_total': lambda virtual_mem, _swap_mem: _format_total_size(virtual_mem.total),
+    'virtual_mem_avail': lambda virtual_mem, _swap_mem: format_size(virtual_mem.available),
+    'swap_mem_free': lambda _virtual_mem, swap_mem: format_size(swap_mem.free),
+    'swap_mem_percent': lambda _virtual_mem, swap_mem: swap_mem.percent,
+    'swap_mem_total': lambda _virtual_mem, swap_mem: _format_total_size(swap_mem.total)
+}
+
 
 class MemoryWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
+    metric_source = "memory"
 
     def __init__(
             self,
@@ -23,6 +40,13 @@ class MemoryWidget(BaseWidget):
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
+
+        # Virtual memory is always sampled, as it determines the status class of the label
+        label_field_names = self._label_template.field_names | self._label_alt_template.field_names
+        is_swap_referenced = any(field_name.startswith("swap_mem_") for field_name in label_field_names)
+        self.metric_fields = frozenset(['virtual_memory', 'swap_memory'] if is_swap_referenced else ['virtual_memory'])
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -56,34 +80,29 @@ class MemoryWidget(BaseWidget):
         self._update_label()
 
     def _update_label(self):
+        # Labels toggled before the first sample arrives stay empty until the sample renders the active label
+        if self.metric_snapshot is None:
+            return
+
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
-            virtual_mem = psutil.virtual_memory()
-            swap_mem = psutil.swap_memory()
+            virtual_mem = self.metric_snapshot['virtual_memory']
+            swap_mem = self.metric_snapshot.get('swap_memory')
 
             threshold = self._get_virtual_memory_threshold(virtual_mem.percent)
-            label_options = [
-                ("{virtual_mem_free}", naturalsize(virtual_mem.free)),
-                ("{virtual_mem_percent}", virtual_mem.percent),
-                ("{virtual_mem_total}", naturalsize(virtual_mem.total)),
-                ("{virtual_mem_avail}", naturalsize(virtual_mem.available)),
-                ("{swap_mem_free}", naturalsize(swap_mem.free)),
-                ("{swap_mem_percent}", swap_mem.percent),
-                ("{swap_mem_total}", naturalsize(swap_mem.total)),
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
+            active_label_formatted = active_label_template.render(**{
+                option: get_option_value(virtual_mem, swap_mem)
+                for option, get_option_value in MEMORY_LABEL_OPTIONS.items()
+                if option in active_label_template.field_names
+            })
 
             alt_class = "alt" if self._show_alt_label else ""
-            active_label.setText(active_label_formatted)
-            active_label.setProperty("class", f"label {alt_class} status-{threshold}")
-            active_label.setStyleSheet('')
+            self.render_label(active_label, active_label_formatted, build_class_name("label", alt_class, f"status-{threshold}"))
         except Exception:
-            active_label.setText(active_label_content)
+            self.render_label(active_label, active_label_content)
             logging.exception("Failed to retrieve updated memory info")
 
     def _get_virtual_memory_threshold(self, virtual_memory_percent) -> str:
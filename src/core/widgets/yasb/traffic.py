@@ -1,18 +1,12 @@
-import psutil
-from humanize import naturalsize
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template, format_size
 from core.validation.widgets.yasb.traffic import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 
 
 class TrafficWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
-
-    # initialize io counters
-    io = psutil.net_io_counters()
-    bytes_sent = io.bytes_sent
-    bytes_recv = io.bytes_recv
-    interval = 1  # second(s)
+    metric_source = "net_io"
 
     def __init__(
         self,
@@ -22,11 +16,12 @@ class TrafficWidget(BaseWidget):
         callbacks: dict[str, str],
     ):
         super().__init__(update_interval, class_name="traffic-widget")
-        self.interval = update_interval // 1000
 
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -63,43 +58,30 @@ class TrafficWidget(BaseWidget):
     def _update_label(self):
         # Update the active label at each timer interval
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
             upload_speed, download_speed = self._get_speed()
         except Exception:
             upload_speed, download_speed = "N/A", "N/A"
 
-        label_options = [
-            ("{upload_speed}", upload_speed),
-            ("{download_speed}", download_speed),
-        ]
-
-        for option, value in label_options:
-            active_label_formatted = active_label_formatted.replace(option, str(value))
-
-        active_label.setText(active_label_formatted)
+        self.render_label(active_label, active_label_template.render(
+            upload_speed=upload_speed,
+            download_speed=download_speed
+        ))
 
     def _get_speed(self) -> [str, str]:
-        current_io = psutil.net_io_counters()
-        upload_diff = current_io.bytes_sent - self.bytes_sent
-        download_diff = current_io.bytes_recv - self.bytes_recv
+        upload_rate = int(self.metric_snapshot['bytes_sent_diff'] / self.metric_snapshot['elapsed'])
+        download_rate = int(self.metric_snapshot['bytes_recv_diff'] / self.metric_snapshot['elapsed'])
 
-        if upload_diff < 1024:
-            upload_speed = f"{upload_diff} B/s"
+        if upload_rate < 1024:
+            upload_speed = f"{upload_rate} B/s"
         else:
-            upload_speed = naturalsize(
-                (current_io.bytes_sent - self.bytes_sent) // self.interval,
-            ) + "/s"
+            upload_speed = format_size(upload_rate) + "/s"
 
-        if download_diff < 1024:
-            download_speed = f"{download_diff} B/s"
+        if download_rate < 1024:
+            download_speed = f"{download_rate} B/s"
         else:
-            download_speed = naturalsize(
-                (current_io.bytes_recv - self.bytes_recv) // self.interval,
-            ) + "/s"
+            download_speed = format_size(download_rate) + "/s"
 
-        self.bytes_sent = current_io.bytes_sent
-        self.bytes_recv = current_io.bytes_recv
         return upload_speed, download_speed
@@ -1,11 +1,12 @@
 from core.widgets.base import BaseWidget
+from core.utils.label_template import compile_template
 from core.validation.widgets.yasb.wifi import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
-import os
 
 
 class WifiWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
+    metric_source = "wifi"
 
     def __init__(
         self,
@@ -21,6 +22,8 @@ class WifiWidget(BaseWidget):
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_template = compile_template(label)
+        self._label_alt_template = compile_template(label_alt)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -55,54 +58,22 @@ class WifiWidget(BaseWidget):
         self._update_label()
 
     def _update_label(self):
+        if self.metric_snapshot is None:
+            return
+
         wifi_icon, _ = self._get_wifi_icon()
-        wifi_name = self._get_wifi_name()
+        wifi_name = self.metric_snapshot['name']
 
         # Determine which label is active
         active_label = self._label_alt if self._show_alt_label else self._label
 
-        label_options = [
-            ("{wifi_icon}", wifi_icon),
-            ("{wifi_name}", wifi_name),
-        ]
-
         # Format the label content
-        updated_content = self._label_alt_content if self._show_alt_label else self._label_content
-        for label_option in label_options:
-            updated_content = updated_content.replace(
-                label_option[0], str(label_option[1])
-            )
-
-        active_label.setText(updated_content)
-
-    def _get_wifi_strength(self):
-        # Get the wifi strength from the system
-        result = os.popen("netsh wlan show interfaces").read()
-
-        # Return 0 if no wifi interface is found
-        if "There is no wireless interface on the system." in result:
-            return 0
-
-        # Extract signal strength from the result
-        for line in result.split("\n"):
-            if "Signal" in line:  # FIXME: This will break if the system language is not English
-                strength = line.split(":")[1].strip().split(" ")[0].replace("%", "")
-                return int(strength)
-
-        return 0
-
-    def _get_wifi_name(self):
-        result = os.popen("netsh wlan show interfaces").read()
-
-        for line in result.split("\n"):
-            if "SSID" in line:
-                return line.split(":")[1].strip()
-
-        return "No WiFi"
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
+        self.render_label(active_label, active_label_template.render(wifi_icon=wifi_icon, wifi_name=wifi_name))
 
     def _get_wifi_icon(self):
         # Map strength to its corresponding icon
-        strength = self._get_wifi_strength()
+        strength = self.metric_snapshot['strength']
 
         if strength == 0:
             return self._wifi_icons[0], strength
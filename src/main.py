@@ -1,33 +1,81 @@
+from core.utils.import_profiler import import_profiler
+from os.path import join
 from sys import argv, exit
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 from core.bar_manager import BarManager
-from core.config import get_config_and_stylesheet
+from core.config import get_config_and_stylesheet, get_config_dir
 from core.log import init_logger
 from core.tray import TrayIcon
 from core.watcher import create_observer
+from core.utils.command_cache import log_command_cache_stats
+from core.utils.command_stream import log_command_stream_stats
+from core.utils.metric_provider import log_metric_provider_stats
+from core.utils.process_runner import process_runner
+from core.utils.profiler import startup_profiler
+from core.utils.render_queue import render_queue
+from core.utils.reports import write_report
+from core.utils.tick_scheduler import tick_scheduler
+from settings import DEFAULT_STARTUP_PROFILE_FILENAME, DEFAULT_IMPORT_PROFILE_FILENAME, DEFAULT_PROCESS_REPORT_FILENAME
+
+
+def on_startup_complete():
+    if startup_profiler.enabled:
+        startup_profiler.mark_startup_complete()
+        startup_profiler.log_report()
+
+        # Stats of the shared update sources are only logged when profiling, rather than on every config reload
+        tick_scheduler.log_stats()
+        render_queue.log_stats()
+        log_metric_provider_stats()
+        log_command_cache_stats()
+        log_command_stream_stats()
+
+        write_report(
+            startup_profiler.report(),
+            join(get_config_dir(), DEFAULT_STARTUP_PROFILE_FILENAME),
+            "startup profile"
+        )
+
+    if import_profiler.enabled:
+        import_profiler.log_report()
+        write_report(
+            import_profiler.report(),
+            join(get_config_dir(), DEFAULT_IMPORT_PROFILE_FILENAME),
+            "import profile"
+        )
 
 
 def main():
-    config, stylesheet = get_config_and_stylesheet()
+    with startup_profiler.phase("get_config_and_stylesheet"):
+        config, stylesheet = get_config_and_stylesheet()
 
-    app = QApplication(argv)
-    app.setQuitOnLastWindowClosed(False)
+    with startup_profiler.phase("create_application"):
+        app = QApplication(argv)
+        app.setQuitOnLastWindowClosed(False)
 
     # Initialise bars and background event listeners
-    manager = BarManager(config, stylesheet)
-    manager.initialize_bars(init=True)
+    with startup_profiler.phase("initialize_bars"):
+        manager = BarManager(config, stylesheet)
+        manager.initialize_bars(init=True)
 
     # Build system tray icon
-    tray_icon = TrayIcon(manager)
-    tray_icon.show()
+    with startup_profiler.phase("create_tray_icon"):
+        tray_icon = TrayIcon(manager)
+        tray_icon.show()
 
     # Initialise file watcher
     if config['watch_config'] or config['watch_stylesheet']:
-        observer = create_observer(manager)
-        observer.start()
+        with startup_profiler.phase("start_file_watcher"):
+            observer = create_observer(manager)
+            observer.start()
     else:
         observer = None
 
+    # Report startup and import profiles once the event loop has processed all pending startup events
+    if startup_profiler.enabled or import_profiler.enabled:
+        QTimer.singleShot(0, on_startup_complete)
+
     # Start Application
     exit_status = app.exec()
 
@@ -35,9 +83,20 @@ def main():
     if observer:
         observer.stop()
         observer.join()
+
+    if "--profile-processes" in argv:
+        process_runner.log_report()
+        write_report(
+            process_runner.report(),
+            join(get_config_dir(), DEFAULT_PROCESS_REPORT_FILENAME),
+            "process report"
+        )
     exit(exit_status)
 
 
 if __name__ == "__main__":
+    if "--profile-startup" in argv:
+        startup_profiler.enable()
+
     init_logger()
     main()
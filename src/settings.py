@@ -13,3 +13,24 @@ DEFAULT_CONFIG_DIRECTORY = ".yasb"
 DEFAULT_STYLES_FILENAME = "styles.css"
 DEFAULT_CONFIG_FILENAME = "config.yaml"
 DEFAULT_LOG_FILENAME = "yasb.log"
+DEFAULT_CACHE_DIRECTORY = ".cache"
+DEFAULT_STARTUP_PROFILE_FILENAME = "startup_profile.json"
+DEFAULT_IMPORT_PROFILE_FILENAME = "import_profile.json"
+DEFAULT_PROCESS_REPORT_FILENAME = "process_report.json"
+
+# Sampling Settings
+SAMPLING_POOL_MAX_THREADS = 4
+VISIBILITY_POLL_INTERVAL = 1000
+
+# Command Settings
+COMMAND_POOL_MAX_THREADS = 4
+PROVIDER_POOL_MAX_THREADS = 2
+BACKGROUND_POOL_MAX_THREADS = 2
+DEFAULT_MAX_CONCURRENT_PROCESSES = 4
+PROCESS_LATENCY_SAMPLES = 1000
+COMMAND_CACHE_TTL_SLACK_MS = 50
+COMMAND_STREAM_RESTART_DELAY_MS = 1000
+COMMAND_STREAM_MAX_RESTART_DELAY_MS = 60000
+
+# Profiling Settings
+DEFAULT_IMPORT_BUDGET_MS = 250